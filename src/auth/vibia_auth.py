@@ -67,13 +67,15 @@ class VibiaAuth:
                 "sec-fetch-site": "same-site",
             }
 
-            # Initialize HTTP client with headers, cookie support, and extended timeout
-            self.client = httpx.Client(
-                headers=browser_headers,
-                follow_redirects=True,
-                http2=True,  # Enable HTTP/2
-                timeout=httpx.Timeout(300.0, connect=10.0)
-            )
+            # Initialize HTTP client with headers, cookie support, and extended timeout.
+            # Re-logins keep the existing client so its pooled connections survive.
+            if self.client is None:
+                self.client = httpx.Client(
+                    headers=browser_headers,
+                    follow_redirects=True,
+                    http2=True,  # Enable HTTP/2
+                    timeout=httpx.Timeout(300.0, connect=10.0)
+                )
 
             # Authenticate with Vibia API
             response = self.client.post(
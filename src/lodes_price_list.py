@@ -6,6 +6,7 @@ Lodes 2025 Price List JSON file (output/price_list_data.json).
 The JSON file is generated by scripts/parse_lodes_price_list.py from the PDF.
 """
 
+import hashlib
 import json
 from pathlib import Path
 from typing import TypedDict
@@ -135,6 +136,12 @@ def _load_json_price_list() -> dict[str, ProductInfo]:
 # Load all products from JSON
 ALL_PRODUCTS = _load_json_price_list()
 
+# Digest of the loaded price list; part of scraper cache keys so cached products
+# are not served after the price list changes
+PRICE_LIST_VERSION = hashlib.sha1(
+    json.dumps(ALL_PRODUCTS, sort_keys=True).encode("utf-8")
+).hexdigest()[:12]
+
 logger.info(f"Price list initialized with {len(ALL_PRODUCTS)} products")
 
 
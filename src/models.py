@@ -18,9 +18,13 @@ Manufacturer = NewType("Manufacturer", str)
 ProductType = Literal["simple", "variable", "variation"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductData:
-    """Structured product data extracted from manufacturer websites."""
+    """Structured product data extracted from manufacturer websites.
+
+    Uses __slots__: batch runs keep many instances alive at once, and slots
+    drop the per-instance __dict__.
+    """
 
     sku: SKU
     name: str
@@ -70,3 +74,4 @@ class ScraperConfig:
     timeout: int = 30  # seconds
     language_priority: list[str] | None = None  # e.g., ["de", "en"]
     default_price: float = 0.0  # Default price for products without pricing
+    cache_ttl_seconds: int = 0  # Disk cache lifetime for scraped results (0 disables)
@@ -18,6 +18,9 @@ from src.ai.description_generator import (
 from src.ai.german_translator import translate_product_data
 from src.downloaders.asset_downloader import download_pdf
 
+# SKUs handed to scraper.prefetch_products() ahead of each sequential scrape window
+PREFETCH_WINDOW = 10
+
 
 class ScraperOrchestrator:
     """Coordinates scraping, data collection, and export workflow."""
@@ -71,7 +74,14 @@ class ScraperOrchestrator:
 
             logger.info(f"Starting scrape for {len(skus)} products from {manufacturer}")
 
-            for sku_str in skus:
+            for index, sku_str in enumerate(skus):
+                if index % PREFETCH_WINDOW == 0:
+                    window = skus[index : index + PREFETCH_WINDOW]
+                    try:
+                        scraper.prefetch_products([SKU(s) for s in window])
+                    except Exception as e:
+                        logger.debug(f"Prefetch failed, scraping without it: {e}")
+
                 sku = SKU(sku_str)
                 try:
                     scraped_products = scraper.scrape_product(sku, output_base=output_dir)
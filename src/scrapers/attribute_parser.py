@@ -4,7 +4,8 @@ Following CLAUDE.md: testable, composable functions with no side effects.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence
 
 from loguru import logger
 
@@ -15,7 +16,14 @@ CERTIFICATION_PATTERNS = [
     (r"\b(CE)\b", "Certification"),
 ]
 
+# Compiled once at import; extract_certifications_from_html runs on every product page
+_COMPILED_CERTIFICATION_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), attr_name)
+    for pattern, attr_name in CERTIFICATION_PATTERNS
+]
+
 
+@lru_cache(maxsize=4096)
 def parse_designer_from_title(title: str) -> Optional[str]:
     """Extract designer name from product title.
 
@@ -38,15 +46,26 @@ def parse_designer_from_title(title: str) -> Optional[str]:
     return designer_name if designer_name else None
 
 
-def parse_table_header_attributes(header_texts: list[str]) -> dict[str, str]:
+def parse_table_header_attributes(header_texts: Sequence[str]) -> dict[str, str]:
     """Parse attribute key-value pairs from table header texts.
 
+    Header rows repeat across products of a collection, so results are
+    memoized on the tuple of header texts.
+
     Args:
-        header_texts: List of header cell texts (e.g., ["Structure: Metal", "Light source"])
+        header_texts: Header cell texts (e.g., ["Structure: Metal", "Light source"])
 
     Returns:
-        Dictionary of parsed attributes
+        Dictionary of parsed attributes (a fresh copy, safe to mutate)
     """
+    return dict(_parse_table_header_attributes_cached(tuple(header_texts)))
+
+
+@lru_cache(maxsize=4096)
+def _parse_table_header_attributes_cached(
+    header_texts: tuple[str, ...],
+) -> dict[str, str]:
+    """Memoized implementation of parse_table_header_attributes (do not mutate result)."""
     attributes = {}
 
     for header_text in header_texts:
@@ -103,6 +122,7 @@ def clean_variant_header_name(header_text: str) -> str:
     return header_text
 
 
+@lru_cache(maxsize=4096)
 def parse_weight_from_text(text: str) -> Optional[str]:
     """Extract weight from text content (multilingual).
 
@@ -188,8 +208,8 @@ def extract_certifications_from_html(html: str) -> dict[str, str]:
     """
     certifications = {}
 
-    for pattern, attr_name in CERTIFICATION_PATTERNS:
-        match = re.search(pattern, html, re.IGNORECASE)
+    for pattern, attr_name in _COMPILED_CERTIFICATION_PATTERNS:
+        match = pattern.search(html)
         if match:
             certifications[attr_name] = match.group(1).strip()
 
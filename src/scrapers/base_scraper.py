@@ -3,20 +3,79 @@
 Following CLAUDE.md: shared logic in base class, specific implementation in subclasses.
 """
 
+import atexit
 import glob
 import os
 import platform
 import subprocess
 import time
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Optional
 
-from playwright.sync_api import sync_playwright, Browser, Page, Playwright
+import httpx
+from playwright.sync_api import (
+    sync_playwright,
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Route,
+)
 from loguru import logger
 
 from src.models import SKU, ProductData, ScraperConfig
 from src.downloaders.asset_downloader import download_image
 
+# Browser downloads land here instead of the system temp dir, so moving them
+# into the output tree is a same-filesystem rename rather than a full copy
+DOWNLOADS_DIR = Path("output/.downloads")
+
+# Process-wide Playwright driver and browsers (keyed by launch options).
+# Scrapers get their own BrowserContext from a shared browser instead of
+# paying a Chromium cold start each. Sync Playwright is bound to the thread
+# that started it, so this is shared per process, not across threads.
+_shared_playwright: Optional[Playwright] = None
+_shared_browsers: dict[tuple, Browser] = {}
+
+
+def get_shared_browser(launch_options: dict) -> Browser:
+    """Return the process-wide browser for these launch options.
+
+    Args:
+        launch_options: Keyword arguments for chromium.launch()
+
+    Returns:
+        Connected Playwright Browser, launched on first use
+    """
+    global _shared_playwright
+
+    key = tuple(sorted(launch_options.items()))
+    browser = _shared_browsers.get(key)
+    if browser is None or not browser.is_connected():
+        if _shared_playwright is None:
+            _shared_playwright = sync_playwright().start()
+            atexit.register(close_shared_browsers)
+        browser = _shared_playwright.chromium.launch(**launch_options)
+        _shared_browsers[key] = browser
+    return browser
+
+
+def close_shared_browsers() -> None:
+    """Close all shared browsers and stop the Playwright driver."""
+    global _shared_playwright
+
+    for browser in _shared_browsers.values():
+        try:
+            browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing shared browser: {e}")
+    _shared_browsers.clear()
+
+    if _shared_playwright is not None:
+        _shared_playwright.stop()
+        _shared_playwright = None
+
 
 class BaseScraper(ABC):
     """Abstract base class providing common scraping functionality.
@@ -26,6 +85,10 @@ class BaseScraper(ABC):
     - build_product_url(sku) - Construct product URL from SKU
     """
 
+    # Resource types aborted in the browser; <img src> attributes stay readable,
+    # only the bytes are skipped since images are downloaded separately
+    BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset({"image", "media", "font"})
+
     def __init__(self, config: ScraperConfig):
         """Initialize scraper with configuration.
 
@@ -33,12 +96,13 @@ class BaseScraper(ABC):
             config: Scraper configuration including rate limits, timeouts
         """
         self.config = config
-        self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        self._http_client: Optional[httpx.Client] = None
 
     def setup_browser(self, headless: bool = True) -> Page:
-        """Initialize Playwright browser and return page instance.
+        """Open a browser context on the shared browser and return its page.
 
         Args:
             headless: Whether to run browser in headless mode
@@ -49,10 +113,10 @@ class BaseScraper(ABC):
         if self._page is not None:
             return self._page
 
-        self._playwright = sync_playwright().start()
+        DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
+        launch_options = {"headless": headless, "downloads_path": str(DOWNLOADS_DIR)}
 
         # On Mac, Playwright needs explicit executable path within Chromium.app bundle
-        launch_options = {"headless": headless}
         if os.getenv("PLAYWRIGHT_BROWSERS_PATH") and os.name != "nt":
             # Mac/Linux: Chromium is packaged as .app bundle
             if platform.system() == "Darwin":
@@ -107,26 +171,94 @@ class BaseScraper(ABC):
                     if fallback_path:
                         launch_options["executable_path"] = fallback_path
 
-        self._browser = self._playwright.chromium.launch(**launch_options)
-        self._page = self._browser.new_page()
+        self._browser = get_shared_browser(launch_options)
+        # One context for the scraper's lifetime so cookies and keep-alive
+        # connections are reused across SKUs instead of re-handshaking per page
+        self._context = self._browser.new_context()
+        if self.BLOCKED_RESOURCE_TYPES:
+            self._context.route("**/*", self._route_request)
+        self._page = self._context.new_page()
 
-        logger.info(f"Browser initialized for {self.config.manufacturer}")
+        logger.info(f"Browser context opened for {self.config.manufacturer}")
         return self._page
 
+    def _route_request(self, route: Route) -> None:
+        """Abort blocked resource types and let everything else through.
+
+        Args:
+            route: Intercepted Playwright route
+        """
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
     def teardown_browser(self) -> None:
-        """Close browser and cleanup resources."""
+        """Close this scraper's browser context and cleanup resources.
+
+        The shared browser stays up for other scrapers; it is closed at
+        process exit (or explicitly via close_shared_browsers()).
+        """
         if self._page:
             self._page.close()
-        if self._browser:
-            self._browser.close()
-        if self._playwright:
-            self._playwright.stop()
+        if self._context:
+            self._context.close()
+        if self._http_client:
+            self._http_client.close()
 
         self._page = None
+        self._context = None
         self._browser = None
-        self._playwright = None
+        self._http_client = None
+
+        logger.info(f"Browser context closed for {self.config.manufacturer}")
+
+    def get_http_client(self) -> httpx.Client:
+        """Return the shared HTTP client for requests that don't need JS.
+
+        The client is created lazily and kept open until teardown, so static
+        fetches reuse one HTTP/2 connection per host across all SKUs.
+
+        Returns:
+            httpx Client instance
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                http2=True,
+                follow_redirects=True,
+                timeout=self.config.timeout,
+            )
+        return self._http_client
+
+    def _url_exists(self, url: str) -> bool:
+        """Probe a URL with a HEAD request before paying for a browser render.
+
+        Only a definite 404/410 counts as missing; any other status or a
+        network error defers to the browser navigation.
 
-        logger.info(f"Browser closed for {self.config.manufacturer}")
+        Args:
+            url: URL to probe
+
+        Returns:
+            False if the page is known not to exist, True otherwise
+        """
+        try:
+            response = self.get_http_client().head(url)
+        except httpx.HTTPError as e:
+            logger.debug(f"HEAD probe failed for {url}: {e}")
+            return True
+        return response.status_code not in (404, 410)
+
+    def prefetch_products(self, skus: list[SKU]) -> None:
+        """Warm per-product caches for an upcoming batch of SKUs.
+
+        Called by the orchestrator before scraping each window of SKUs so
+        scrapers can fetch static data concurrently while browser work stays
+        sequential. The default implementation does nothing.
+
+        Args:
+            skus: SKUs that will be passed to scrape_product next
+        """
 
     def rate_limit(self) -> None:
         """Apply rate limiting between requests."""
@@ -4,10 +4,19 @@ Following CLAUDE.md: manufacturer-specific logic only, inherits common functiona
 Based on lodes_structure.md selector mappings.
 """
 
+import hashlib
+import json
+import os
 import re
+import string
+import time
+from dataclasses import asdict
+from pathlib import Path
 
 from loguru import logger
-from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
+from playwright.sync_api import Page, Response, TimeoutError as PlaywrightTimeout
 
 from src.scrapers.base_scraper import BaseScraper
 from src.scrapers.attribute_parser import (
@@ -24,6 +33,19 @@ from src.scrapers.attribute_parser import (
 from src.models import SKU, ImageUrl, Manufacturer, ProductData, ScraperConfig
 from src import lodes_price_list
 
+# Compiled once at import; these run per link on category pages and per SKU
+_PRODUCT_URL_RE = re.compile(r"/(?:producten|products|prodotti|produkte)/([^/?]+)")
+_NUMERIC_SKU_RE = re.compile(r"^\d+(\s+\d+)?$")
+_CABLE_LENGTH_RE = re.compile(r"(?:max\s+)?(\d+)\s*cm", re.IGNORECASE)
+_COLOR_CODE_SUFFIX_RE = re.compile(r"\s*[–-]\s*\d+")
+
+DEFAULT_CACHE_TTL = 6 * 60 * 60  # seconds; override with the LODES_CACHE_TTL env var
+
+# Characters allowed in a SKU or slug (e.g. "kelly", "09622 1000")
+_SKU_ALLOWED_CHARS = frozenset(
+    string.ascii_letters + string.digits + string.whitespace + "_-"
+)
+
 
 def _is_numeric_sku(sku: str) -> bool:
     """Check if SKU is in numeric format (pure function).
@@ -48,12 +70,15 @@ def _is_numeric_sku(sku: str) -> bool:
         >>> _is_numeric_sku("14126-abc")
         False
     """
-    return bool(re.match(r"^\d+(\s+\d+)?$", sku))
+    return bool(_NUMERIC_SKU_RE.match(sku))
 
 
 class LodesScraper(BaseScraper):
     """Scraper for Lodes.com product pages."""
 
+    # Everything is read from the HTML snapshot, so styles are never needed
+    BLOCKED_RESOURCE_TYPES = BaseScraper.BLOCKED_RESOURCE_TYPES | {"stylesheet"}
+
     # Configuration constants
     MIN_DESCRIPTION_LENGTH = 20
     MAX_IMAGES = 10
@@ -66,9 +91,31 @@ class LodesScraper(BaseScraper):
         "avatar",
         "placeholder",
     ]
+    # All exclude patterns folded into one alternation so each URL is scanned once
+    IMAGE_EXCLUDE_RE = re.compile(
+        "|".join(map(re.escape, IMAGE_EXCLUDE_PATTERNS)), re.IGNORECASE
+    )
+    # WordPress thumbnail/scaled suffixes stripped to get the full resolution image
+    IMAGE_SIZE_SUFFIX_RE = re.compile(r"-(?:scaled|150x150|300x300|1024x1024)")
+
+    # Elements whose presence means a page has the content we scrape
+    PRODUCT_TITLE_SELECTOR = "h1.inline.title-n.font26.serif"
+    SECONDARY_INFO_SELECTOR = "div.secondary-info"
+    PRODUCT_LINK_SELECTOR = (
+        "a[href*='/producten/'], a[href*='/prodotti/'], "
+        "a[href*='/produkte/'], a[href*='/products/']"
+    )
+    # Upper bound for the ready-selector wait after DOMContentLoaded
+    READY_SELECTOR_TIMEOUT_MS = 10000
+    # Lazy-load scrolling on category pages stops once the link count stops growing
+    MAX_CATEGORY_SCROLLS = 10
+    CATEGORY_SCROLL_WAIT_MS = 400
+    # Consecutive scrolls without new links before giving up
+    CATEGORY_SCROLL_STABLE_LIMIT = 2
 
     # Product code pattern (format: "14126 1000" - 5 digits, space, 4 digits)
     PRODUCT_CODE_PATTERN = r"^\d{5}\s+\d{4}$"
+    PRODUCT_CODE_RE = re.compile(PRODUCT_CODE_PATTERN)
 
     # Color name to code mapping (handles Italian/English/German names)
     COLOR_NAME_TO_CODE = {
@@ -106,8 +153,12 @@ class LodesScraper(BaseScraper):
             timeout=30,
             language_priority=["de", "en"],  # Try German first, fall back to English
             default_price=0.0,
+            # Category/product pages rarely change; LODES_CACHE_TTL=0 disables the cache
+            cache_ttl_seconds=int(os.getenv("LODES_CACHE_TTL", DEFAULT_CACHE_TTL)),
         )
         super().__init__(config)
+        self._category_cache_dir = Path(".cache/lodes/categories")
+        self._product_cache_dir = Path(".cache/lodes/products")
 
     def build_product_url(self, sku: SKU, language: str = "en") -> str:
         """Construct product URL from SKU with language support.
@@ -131,6 +182,102 @@ class LodesScraper(BaseScraper):
             self.setup_browser()
         assert self._page is not None
 
+    def _get_cache_file(self, cache_dir: Path, key: str) -> Path:
+        """Build cache file path for a cache key (SHA-1 of the key)."""
+        return cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _load_from_cache(self, cache_file: Path) -> dict | None:
+        """Load cached data if it is younger than the configured TTL.
+
+        Args:
+            cache_file: Path to the JSON cache file
+
+        Returns:
+            Cached data or None if caching is disabled, missing or expired
+        """
+        ttl = self.config.cache_ttl_seconds
+        if ttl <= 0 or not cache_file.exists():
+            return None
+
+        if cache_file.stat().st_mtime <= time.time() - ttl:
+            return None
+
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load from cache {cache_file}: {e}")
+            return None
+
+    def _save_to_cache(self, cache_file: Path, data: dict) -> None:
+        """Save data to a JSON cache file (no-op when caching is disabled).
+
+        Args:
+            cache_file: Path to the JSON cache file
+            data: JSON-serializable data to store
+        """
+        if self.config.cache_ttl_seconds <= 0:
+            return
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump({**data, "ts": time.time()}, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"Failed to save to cache {cache_file}: {e}")
+
+    def _goto(self, url: str, ready_selector: str) -> Response | None:
+        """Navigate to URL and wait for the element the scraper needs.
+
+        Waits for DOMContentLoaded and then for ready_selector instead of
+        networkidle, so long-polling trackers can't stall every page load.
+        A missing selector is not an error here; callers check the response
+        status and extract what is present.
+
+        Args:
+            url: URL to navigate to
+            ready_selector: CSS selector that marks the page as ready
+
+        Returns:
+            Navigation response (None for same-document navigations)
+        """
+        response = self._page.goto(
+            url, wait_until="domcontentloaded", timeout=self.config.timeout * 1000
+        )
+        try:
+            self._page.wait_for_selector(
+                ready_selector, timeout=self.READY_SELECTOR_TIMEOUT_MS
+            )
+        except PlaywrightTimeout:
+            logger.debug(
+                f"'{ready_selector}' not found after "
+                f"{self.READY_SELECTOR_TIMEOUT_MS}ms: {url}"
+            )
+        return response
+
+    def _scroll_to_load_products(self) -> None:
+        """Scroll the category page until no further product links appear.
+
+        Stops after CATEGORY_SCROLL_STABLE_LIMIT consecutive scrolls without
+        new links, so short categories finish quickly while slow infinite
+        scroll still gets a second chance.
+        """
+        count_script = """(selector) => document.querySelectorAll(selector).length"""
+        link_count = self._page.evaluate(count_script, self.PRODUCT_LINK_SELECTOR)
+        stable_scrolls = 0
+
+        for _ in range(self.MAX_CATEGORY_SCROLLS):
+            self._page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            self._page.wait_for_timeout(self.CATEGORY_SCROLL_WAIT_MS)
+            new_count = self._page.evaluate(count_script, self.PRODUCT_LINK_SELECTOR)
+            if new_count <= link_count:
+                stable_scrolls += 1
+                if stable_scrolls >= self.CATEGORY_SCROLL_STABLE_LIMIT:
+                    break
+            else:
+                stable_scrolls = 0
+                link_count = new_count
+
     def _convert_to_german_url(self, url: str) -> str:
         """Convert any Lodes URL to German version."""
         if "/de/" in url:
@@ -152,46 +299,44 @@ class LodesScraper(BaseScraper):
         Raises:
             Exception: If category scraping fails
         """
-        self._ensure_browser()
         category_url = self._convert_to_german_url(category_url)
+
+        cache_file = self._get_cache_file(self._category_cache_dir, category_url)
+        cached = self._load_from_cache(cache_file)
+        if cached is not None:
+            logger.info(f"Using cached category {category_url}")
+            return [SKU(sku) for sku in cached["skus"]]
+
+        self._ensure_browser()
         logger.info(f"Scraping Lodes category (German): {category_url}")
 
         try:
-            response = self._page.goto(
-                category_url,
-                wait_until="networkidle",
-                timeout=self.config.timeout * 1000,
-            )
+            response = self._goto(category_url, self.PRODUCT_LINK_SELECTOR)
 
             if response and response.status >= 400:
                 raise Exception(f"HTTP {response.status} error for {category_url}")
 
             # Scroll to load all products
-            for _ in range(5):
-                self._page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                self._page.wait_for_timeout(1000)
-
-            # Debug: log all links to understand page structure
-            all_links = self._page.query_selector_all("a[href]")
-            logger.debug(f"Found {len(all_links)} total links on page")
-            sample_hrefs = [link.get_attribute("href") for link in all_links[:20]]
-            logger.debug(f"Sample links: {sample_hrefs}")
-
-            # Try various product link patterns (producten, prodotti, produkte, products)
-            product_links = self._page.query_selector_all(
-                "a[href*='/producten/'], a[href*='/prodotti/'], a[href*='/produkte/'], a[href*='/products/']"
+            self._scroll_to_load_products()
+
+            # Read every href in one browser call, then match product links in Python
+            all_hrefs = self._page.eval_on_selector_all(
+                "a[href]", "links => links.map(a => a.getAttribute('href'))"
             )
-            seen_skus = set()
+            logger.debug(f"Found {len(all_hrefs)} total links on page")
+            logger.debug(f"Sample links: {all_hrefs[:20]}")
 
-            for link in product_links:
-                href = link.get_attribute("href")
+            # Product link patterns (producten, prodotti, produkte, products)
+            seen_skus: dict[SKU, None] = {}
+            for href in all_hrefs:
                 if href:
                     sku = self._extract_sku_from_url(href)
                     if sku:
-                        seen_skus.add(sku)
+                        seen_skus[sku] = None
 
             skus = list(seen_skus)
             logger.info(f"Found {len(skus)} products in category {category_url}")
+            self._save_to_cache(cache_file, {"skus": skus})
             self.rate_limit()
 
             return skus
@@ -210,7 +355,7 @@ class LodesScraper(BaseScraper):
             Product SKU/slug or None if not found
         """
         # Match various product URL patterns (producten, products, prodotti, produkte)
-        match = re.search(r"/(?:producten|products|prodotti|produkte)/([^/?]+)", url)
+        match = _PRODUCT_URL_RE.search(url)
         if match:
             return SKU(match.group(1))
         return None
@@ -234,7 +379,7 @@ class LodesScraper(BaseScraper):
             raise ValueError("SKU cannot be empty")
 
         # Allow alphanumeric, hyphens, underscores, and spaces (for SKUs like "09622 1000")
-        if not re.match(r"^[a-zA-Z0-9_\s-]+$", sku):
+        if not _SKU_ALLOWED_CHARS.issuperset(sku):
             raise ValueError(f"SKU contains invalid characters: {sku}")
 
         # Auto-detect if input is numeric SKU or slug
@@ -251,6 +396,16 @@ class LodesScraper(BaseScraper):
                 raise ValueError(f"SKU '{sku}' (base: '{base_sku}') not found in price list")
             logger.info(f"Found URL slug '{url_slug}' for SKU '{sku}'")
 
+        # Products carry price list data (prices, variants), so a new price list
+        # must not be answered from the cache
+        cache_file = self._get_cache_file(
+            self._product_cache_dir, f"{sku}@{lodes_price_list.PRICE_LIST_VERSION}"
+        )
+        cached = self._load_from_cache(cache_file)
+        if cached is not None:
+            logger.info(f"Using cached product data for {sku}")
+            return [ProductData(**product) for product in cached["products"]]
+
         self._ensure_browser()
 
         # Check if this product has price list data (use url_slug for lookup)
@@ -270,10 +425,13 @@ class LodesScraper(BaseScraper):
             url = self.build_product_url(url_slug, language=lang)
             logger.info(f"Trying to scrape Lodes product ({lang}): {url}")
 
+            if not self._url_exists(url):
+                logger.warning(f"{url} not found, trying next language")
+                last_error = Exception(f"Product page not found: {url}")
+                continue
+
             try:
-                response = self._page.goto(
-                    url, wait_until="networkidle", timeout=self.config.timeout * 1000
-                )
+                response = self._goto(url, self.PRODUCT_TITLE_SELECTOR)
 
                 if response and response.status >= 400:
                     logger.warning(
@@ -298,12 +456,30 @@ class LodesScraper(BaseScraper):
             raise last_error if last_error else Exception(f"Could not scrape {sku}")
 
         try:
-            name = self._extract_product_name(self._page)
-            description = self._extract_description(self._page)
-            images = self._extract_images(self._page)
-            attributes = self._extract_attributes(self._page)
-            categories = self._extract_categories(self._page)
-            variants = self._extract_variants(self._page)
+            has_variant_tables = self._expand_technical_sheet_dropdown(self._page)
+            # Serialize the DOM once (after expanding) and parse it locally
+            # instead of one browser round-trip per element
+            page_html = self._page.content()
+            tree = lxml_html.fromstring(page_html)
+
+            # Texts read by several extractors are taken from the tree once
+            title_text = self._select_text(tree, self.PRODUCT_TITLE_SELECTOR)
+            info_text = self._select_text(tree, self.SECONDARY_INFO_SELECTOR)
+
+            name = self._extract_product_name(tree, title_text)
+            description = self._extract_description(tree)
+            images = self._extract_images(tree)
+            # Variant tables are parsed once and shared by header attributes and variants
+            variant_tables = (
+                self._parse_variant_tables(tree) if has_variant_tables else []
+            )
+            attributes = self._extract_attributes(
+                self._page, tree, page_html, title_text, info_text, variant_tables
+            )
+            categories = self._extract_categories(tree)
+            variants = (
+                self._extract_variants(tree, variant_tables) if variant_tables else []
+            )
 
             # Extract weight as float from attributes
             weight_kg = None
@@ -335,7 +511,7 @@ class LodesScraper(BaseScraper):
                 logger.info(f"Found installation manual: {installation_manual}")
 
             # Extract cable length
-            cable_length = self._extract_cable_length(self._page)
+            cable_length = self._extract_cable_length(tree, info_text)
             if cable_length:
                 logger.info(f"Found cable length: {cable_length}")
 
@@ -361,6 +537,7 @@ class LodesScraper(BaseScraper):
                 logger.info(
                     f"Successfully scraped {name} (SKU: {sku}) in {scraped_lang}"
                 )
+                self._save_to_cache(cache_file, {"products": [asdict(product)]})
                 self.rate_limit()
 
                 return [product]
@@ -390,6 +567,9 @@ class LodesScraper(BaseScraper):
             logger.info(
                 f"Successfully scraped {name} with {len(products)-1} variations"
             )
+            self._save_to_cache(
+                cache_file, {"products": [asdict(product) for product in products]}
+            )
             self.rate_limit()
 
             return products
@@ -398,74 +578,100 @@ class LodesScraper(BaseScraper):
             logger.error(f"Failed to extract data from {url}: {e}")
             raise
 
-    def _extract_product_name(self, page: Page) -> str:
-        """Extract product name from h1.inline.title-n.font26.serif."""
-        title_elem = page.query_selector("h1.inline.title-n.font26.serif")
-        if title_elem:
-            text = title_elem.text_content()
-            if text:
-                return text.strip()
+    @staticmethod
+    def _select_text(tree: HtmlElement, selector: str) -> str | None:
+        """Return the text content of the first element matching selector.
+
+        Args:
+            tree: Parsed product page
+            selector: CSS selector
+
+        Returns:
+            Text content or None if no element matches
+        """
+        matches = tree.cssselect(selector)
+        return matches[0].text_content() if matches else None
+
+    def _extract_product_name(self, tree: HtmlElement, title_text: str | None) -> str:
+        """Extract product name from h1.inline.title-n.font26.serif.
+
+        Args:
+            tree: Parsed product page (for the <title> fallback)
+            title_text: Text of the product heading, if present
+        """
+        if title_text:
+            return title_text.strip()
 
         # Fallback to page title
-        title = page.title()
+        title = tree.findtext(".//title")
         return title.split("|")[0].strip() if title else "Unknown Product"
 
-    def _extract_description(self, page: Page) -> str:
+    def _extract_description(self, tree: HtmlElement) -> str:
         """Extract product description from div.largh60.pos-Sinistra."""
-        # Primary selector for description
-        desc_elem = page.query_selector("div.largh60.pos-Sinistra")
-        if desc_elem:
-            text = desc_elem.text_content()
-            if text and len(text.strip()) > self.MIN_DESCRIPTION_LENGTH:
-                return text.strip()
-
-        # Alternative selector
-        desc_elem = page.query_selector("div.font26.serif.text-more")
-        if desc_elem:
-            text = desc_elem.text_content()
+        # Primary selector, then alternative selector
+        for selector in ("div.largh60.pos-Sinistra", "div.font26.serif.text-more"):
+            text = self._select_text(tree, selector)
             if text and len(text.strip()) > self.MIN_DESCRIPTION_LENGTH:
                 return text.strip()
 
         logger.warning("No description found for product")
         return "No description available"
 
-    def _extract_images(self, page: Page) -> list[ImageUrl]:
+    def _extract_images(self, tree: HtmlElement) -> list[ImageUrl]:
         """Extract product image URLs from carousel."""
-        images = []
+        # Insertion-ordered dict doubles as an ordered set: dedup happens while collecting
+        images: dict[ImageUrl, None] = {}
 
         # Primary selector for carousel images
-        carousel_images = page.query_selector_all("img.carousel-cell-image")
-
-        for img in carousel_images:
-            src = img.get_attribute("src")
+        for img in tree.cssselect("img.carousel-cell-image"):
+            src = img.get("src")
             if src and self._is_product_image(src):
                 # Get full resolution URL
                 full_src = self._get_full_resolution_url(src)
 
                 # Validate URL format
                 if self._is_valid_url(full_src):
-                    images.append(ImageUrl(full_src))
+                    images[ImageUrl(full_src)] = None
+                    # Stop at the cap; later carousel slides are never used
+                    if len(images) >= self.MAX_IMAGES:
+                        break
                 else:
                     logger.warning(f"Invalid image URL skipped: {full_src}")
 
-        # Remove duplicates while preserving order
-        unique_images = list(dict.fromkeys(images))
-
-        if not unique_images:
+        if not images:
             logger.warning("No product images found")
 
-        return unique_images[: self.MAX_IMAGES]
+        return list(images)
+
+    def _extract_attributes(
+        self,
+        page: Page,
+        tree: HtmlElement,
+        page_html: str,
+        title_text: str | None,
+        info_text: str | None,
+        variant_tables: list[dict],
+    ) -> dict[str, str]:
+        """Extract technical specifications from variant dropdowns.
 
-    def _extract_attributes(self, page: Page) -> dict[str, str]:
-        """Extract technical specifications from variant dropdowns."""
+        Args:
+            page: Playwright Page, used for text-matching link selectors
+            tree: Parsed page HTML taken after the dropdown was expanded
+            page_html: The HTML the tree was parsed from
+            title_text: Text of the product heading, if present
+            info_text: Text of div.secondary-info, if present
+            variant_tables: Output of _parse_variant_tables; table lookups are
+                skipped when empty
+        """
         attributes = {}
 
-        attributes.update(self._extract_designer(page))
-        attributes.update(self._extract_table_attributes(page))
-        attributes.update(self._extract_weight_from_pesi(page))
+        attributes.update(self._extract_designer(title_text))
+        if variant_tables:
+            attributes.update(self._extract_table_attributes(variant_tables))
+        attributes.update(self._extract_weight_from_pesi(tree))
 
         # Extract from secondary-info (fallback for weight, also has hills)
-        secondary_attrs = self._extract_from_secondary_info(page)
+        secondary_attrs = self._extract_from_secondary_info(info_text)
         # Only use weight from secondary-info if not already found
         if "Net weight" not in attributes and "Net weight" in secondary_attrs:
             attributes["Net weight"] = secondary_attrs["Net weight"]
@@ -473,84 +679,81 @@ class LodesScraper(BaseScraper):
         if "Hills" in secondary_attrs:
             attributes["Hills"] = secondary_attrs["Hills"]
 
-        attributes.update(self._extract_certifications(page, attributes))
+        attributes.update(self._extract_certifications(page_html, attributes))
         attributes.update(self._extract_pdf_link(page))
 
         # Extract dimensions and Kelvin from table cells
-        attributes.update(self._extract_dimensions_and_kelvin(page))
+        attributes.update(
+            self._extract_dimensions_and_kelvin(tree, info_text, bool(variant_tables))
+        )
 
         return attributes
 
-    def _extract_designer(self, page: Page) -> dict[str, str]:
+    def _extract_designer(self, title_text: str | None) -> dict[str, str]:
         """Extract designer from product title."""
         try:
-            title_elem = page.query_selector("h1.inline.title-n.font26.serif")
-            if title_elem:
-                title_text = title_elem.text_content()
-                if title_text:
-                    designer = parse_designer_from_title(title_text)
-                    if designer:
-                        return {"Designer": designer}
+            if title_text:
+                designer = parse_designer_from_title(title_text)
+                if designer:
+                    return {"Designer": designer}
         except Exception as e:
             logger.warning(f"Failed to extract designer: {e}")
         return {}
 
-    def _extract_table_attributes(self, page: Page) -> dict[str, str]:
-        """Extract attributes from technical specification table."""
+    def _extract_table_attributes(self, variant_tables: list[dict]) -> dict[str, str]:
+        """Extract attributes from technical specification table headers."""
         try:
-            self._expand_technical_sheet_dropdown(page)
-            header_texts = self._get_table_header_texts(page)
+            header_texts = tuple(
+                text.strip()
+                for table in variant_tables
+                for text in table["header_cells"]
+                if text.strip()
+            )
             return parse_table_header_attributes(header_texts)
         except Exception as e:
             logger.warning(f"Failed to extract table attributes: {e}")
             return {}
 
-    def _extract_weight_from_pesi(self, page: Page) -> dict[str, str]:
+    def _extract_weight_from_pesi(self, tree: HtmlElement) -> dict[str, str]:
         """Extract weight from div.left.pesi element."""
         try:
-            weight_elem = page.query_selector("div.left.pesi")
-            if weight_elem:
-                weight_text = weight_elem.text_content()
-                if weight_text:
-                    weight = parse_weight_from_text(weight_text)
-                    if weight:
-                        return {"Net weight": weight}
+            weight_text = self._select_text(tree, "div.left.pesi")
+            if weight_text:
+                weight = parse_weight_from_text(weight_text)
+                if weight:
+                    return {"Net weight": weight}
         except Exception as e:
             logger.warning(f"Failed to extract weight from pesi div: {e}")
         return {}
 
-    def _extract_from_secondary_info(self, page: Page) -> dict[str, str]:
-        """Extract weight and hills from secondary-info element.
+    def _extract_from_secondary_info(self, info_text: str | None) -> dict[str, str]:
+        """Extract weight and hills from secondary-info text.
 
         Returns all found attributes. Caller decides whether to use them
         based on what's already been extracted.
         """
         try:
-            secondary_info = page.query_selector("div.secondary-info")
-            if secondary_info:
-                info_text = secondary_info.text_content()
-                if info_text:
-                    extracted = {}
+            if info_text:
+                extracted = {}
 
-                    weight = parse_weight_from_text(info_text)
-                    if weight:
-                        extracted["Net weight"] = weight
+                weight = parse_weight_from_text(info_text)
+                if weight:
+                    extracted["Net weight"] = weight
 
-                    hills = parse_hills_from_text(info_text)
-                    if hills:
-                        extracted["Hills"] = hills
+                hills = parse_hills_from_text(info_text)
+                if hills:
+                    extracted["Hills"] = hills
 
-                    return extracted
+                return extracted
         except Exception as e:
             logger.warning(f"Failed to extract from secondary-info: {e}")
         return {}
 
     def _extract_certifications(
-        self, page: Page, existing_attrs: dict[str, str]
+        self, page_html: str, existing_attrs: dict[str, str]
     ) -> dict[str, str]:
         """Extract certifications from page HTML."""
         try:
-            page_html = page.content()
             certifications = extract_certifications_from_html(page_html)
             # Only add certifications not already present
             return {
@@ -635,7 +838,7 @@ class LodesScraper(BaseScraper):
 
         return ""
 
-    def _extract_cable_length(self, page: Page) -> str:
+    def _extract_cable_length(self, tree: HtmlElement, info_text: str | None) -> str:
         """Extract cable/rope length from product specifications.
 
         Looks for patterns like:
@@ -647,52 +850,54 @@ class LodesScraper(BaseScraper):
         """
         try:
             # Check secondary info section
-            secondary = page.query_selector("div.secondary-info")
-            if secondary:
-                text = secondary.text_content()
+            if info_text:
                 # Look for patterns like "max 250cm", "Seillänge: 300 cm"
-                match = re.search(r"(?:max\s+)?(\d+)\s*cm", text, re.IGNORECASE)
+                match = _CABLE_LENGTH_RE.search(info_text)
                 if match:
                     return f"max {match.group(1)}cm"
 
             # Check all table cells for cable/rope length
-            tables = page.query_selector_all("table")
-            for table in tables:
-                cells = table.query_selector_all("td, th")
-                for cell in cells:
-                    text = cell.text_content()
-                    if "seil" in text.lower() or "cable" in text.lower():
-                        match = re.search(r"(?:max\s+)?(\d+)\s*cm", text, re.IGNORECASE)
-                        if match:
-                            return f"max {match.group(1)}cm"
+            for cell in tree.cssselect("table td, table th"):
+                text = cell.text_content()
+                if "seil" in text.lower() or "cable" in text.lower():
+                    match = _CABLE_LENGTH_RE.search(text)
+                    if match:
+                        return f"max {match.group(1)}cm"
 
         except Exception as e:
             logger.warning(f"Failed to extract cable length: {e}")
 
         return ""
 
-    def _extract_dimensions_and_kelvin(self, page: Page) -> dict[str, str]:
+    def _extract_dimensions_and_kelvin(
+        self, tree: HtmlElement, info_text: str | None, has_variant_tables: bool = True
+    ) -> dict[str, str]:
         """Extract dimensions and Kelvin temperature from variant table cells.
 
         Searches table cells for:
         - Dimensions (e.g., "910x60mm", "100x50x30cm")
         - Kelvin temperature (e.g., "2700K", "3000°K")
 
+        Args:
+            tree: Parsed page HTML taken after the dropdown was expanded
+            info_text: Text of div.secondary-info, used as dimensions fallback
+            has_variant_tables: Whether variant tables are present; only the
+                secondary-info fallback runs when False
+
         Returns:
             Dictionary with 'Dimensions' and 'Kelvin' keys if found
         """
         extracted = {}
 
         try:
-            # Expand technical sheet dropdown to ensure table is visible
-            self._expand_technical_sheet_dropdown(page)
-
             # Get all table cells (both headers and body cells)
-            variant_tables = page.query_selector_all("table.table-variante")
+            variant_tables = (
+                tree.cssselect("table.table-variante") if has_variant_tables else []
+            )
 
             for table in variant_tables:
                 # Check all cells in the table
-                all_cells = table.query_selector_all("th, td")
+                all_cells = table.cssselect("th, td")
 
                 for cell in all_cells:
                     cell_text = cell.text_content()
@@ -718,75 +923,76 @@ class LodesScraper(BaseScraper):
                             logger.info(f"Found Kelvin: {kelvin}")
 
             # Also check secondary-info and description for dimensions
-            if "Dimensions" not in extracted:
-                secondary_info = page.query_selector("div.secondary-info")
-                if secondary_info:
-                    info_text = secondary_info.text_content()
-                    if info_text:
-                        dimensions = parse_dimensions_from_text(info_text)
-                        if dimensions:
-                            extracted["Dimensions"] = info_text.strip()
+            if "Dimensions" not in extracted and info_text:
+                dimensions = parse_dimensions_from_text(info_text)
+                if dimensions:
+                    extracted["Dimensions"] = info_text.strip()
 
         except Exception as e:
             logger.warning(f"Failed to extract dimensions and Kelvin: {e}")
 
         return extracted
 
-    def _expand_technical_sheet_dropdown(self, page: Page) -> None:
-        """Click dropdown to reveal technical specifications."""
+    def _expand_technical_sheet_dropdown(self, page: Page) -> bool:
+        """Click dropdown to reveal technical specifications.
+
+        Returns:
+            True if variant tables are available for extraction, False if the
+            page has none (downstream table lookups can be skipped)
+        """
         try:
             expand_headers = page.query_selector_all("div.header-variante")
             if expand_headers and len(expand_headers) > 0:
                 expand_headers[0].click()
+                # Tables are read from the HTML snapshot, so being attached is
+                # enough; visibility depends on stylesheets, which are blocked
                 page.wait_for_selector(
-                    "table.table-variante", state="visible", timeout=5000
+                    "table.table-variante", state="attached", timeout=5000
                 )
+                return True
         except PlaywrightTimeout as e:
             logger.warning(f"Could not expand technical sheet dropdown: {e}")
 
-    def _get_table_header_texts(self, page: Page) -> list[str]:
-        """Extract all table header texts from variant tables."""
-        header_texts = []
-        variant_tables = page.query_selector_all("table.table-variante")
+        # Not expanded: tables may still be attached (hidden or always open)
+        return page.query_selector("table.table-variante") is not None
 
-        for table in variant_tables:
-            thead = table.query_selector("thead")
-            if thead:
-                header_cells = thead.query_selector_all("th")
-                for cell in header_cells:
-                    header_text = cell.text_content()
-                    if header_text:
-                        header_texts.append(header_text.strip())
+    @staticmethod
+    def _select_all_texts(tree: HtmlElement, selector: str) -> list[str]:
+        """Return trimmed, non-empty text of every element matching selector."""
+        texts = (el.text_content().strip() for el in tree.cssselect(selector))
+        return [text for text in texts if text]
 
-        return header_texts
+    def _parse_variant_tables(self, tree: HtmlElement) -> list[dict]:
+        """Read every variant table into plain text once.
 
-    def _extract_categories(self, page: Page) -> list[str]:
+        Returns:
+            One dict per table.variante with "header_cells" (all thead th
+            texts), "headers" (first header row) and "rows" (tbody td texts)
+        """
+        tables = []
+        for table in tree.cssselect("table.table-variante"):
+            header_rows = [
+                [th.text_content() for th in tr.cssselect("th")]
+                for tr in table.cssselect("thead tr")
+            ]
+            tables.append(
+                {
+                    "header_cells": [text for row in header_rows for text in row],
+                    "headers": header_rows[0] if header_rows else [],
+                    "rows": [
+                        [td.text_content() for td in tr.cssselect("td")]
+                        for tr in table.cssselect("tbody tr")
+                    ],
+                }
+            )
+        return tables
+
+    def _extract_categories(self, tree: HtmlElement) -> list[str]:
         """Extract product categories from breadcrumbs."""
-        categories = []
-
-        # Extract from breadcrumb navigation
-        breadcrumb_container = page.query_selector("div.bread-crumbs.shadow")
-        if breadcrumb_container:
-            # Get links from bred2 and bred3 spans
-            bred2_link = breadcrumb_container.query_selector("span.bred2 a")
-            if bred2_link:
-                text = bred2_link.text_content()
-                if text and text.strip():
-                    category = text.strip()
-                    # Validate category is meaningful (not just whitespace/special chars)
-                    if len(category) > 0 and not category.isspace():
-                        categories.append(category)
-
-            bred3_link = breadcrumb_container.query_selector("span.bred3 a")
-            if bred3_link:
-                text = bred3_link.text_content()
-                if text and text.strip():
-                    category = text.strip()
-                    if len(category) > 0 and not category.isspace():
-                        categories.append(category)
-
-        # Filter out any empty strings that may have slipped through
-        categories = [c for c in categories if c and c.strip()]
+        categories = self._select_all_texts(
+            tree,
+            "div.bread-crumbs.shadow span.bred2 a, div.bread-crumbs.shadow span.bred3 a",
+        )
 
         return categories if categories else ["Lighting"]
 
@@ -805,7 +1011,7 @@ class LodesScraper(BaseScraper):
         # Clean and normalize the text
         text_lower = color_text.lower().strip()
         # Remove color code suffixes like "– 9005"
-        text_lower = re.sub(r"\s*[–-]\s*\d+", "", text_lower)
+        text_lower = _COLOR_CODE_SUFFIX_RE.sub("", text_lower)
 
         # Check exact match first
         if text_lower in self.COLOR_NAME_TO_CODE:
@@ -1297,9 +1503,15 @@ class LodesScraper(BaseScraper):
 
         return [parent] + children
 
-    def _extract_variants(self, page: Page) -> list[dict[str, str]]:
+    def _extract_variants(
+        self, tree: HtmlElement, variant_tables: list[dict]
+    ) -> list[dict[str, str]]:
         """Extract variant information from variant tables.
 
+        Args:
+            tree: Parsed product page (for div.variante section names)
+            variant_tables: Output of _parse_variant_tables
+
         Returns:
             List of variant dictionaries with SKU and attribute values.
             Empty list if no variants found.
@@ -1307,14 +1519,11 @@ class LodesScraper(BaseScraper):
         variants = []
         seen_codes = set()  # Track seen product codes to avoid duplicates
 
-        variant_tables = page.query_selector_all("table.table-variante")
-
         for table in variant_tables:
-            header_map = self._build_header_index_map(table)
-            rows = table.query_selector_all("tbody tr")
+            header_map = self._build_header_index_map(table["headers"])
 
-            for row in rows:
-                variant_data = self._parse_variant_row(row, header_map)
+            for row_cells in table["rows"]:
+                variant_data = self._parse_variant_row(row_cells, header_map)
                 if variant_data:
                     # Deduplicate by Code/Codice if present
                     code = (
@@ -1331,61 +1540,54 @@ class LodesScraper(BaseScraper):
                     variants.append(variant_data)
 
         # Also check div.variante sections for variant names
-        variant_sections = page.query_selector_all("div.variante")
-        for section in variant_sections:
-            header = section.query_selector(
-                "div.header-variante.relative div.left.col25.font26.serif"
+        for section in tree.cssselect("div.variante"):
+            name_text = self._select_text(
+                section, "div.header-variante.relative div.left.col25.font26.serif"
             )
-            if header:
-                name_text = header.text_content()
-                if name_text and variants:
-                    # Add variant type to first variant if not already present
-                    variants[0]["Variant Type"] = name_text.strip()
+            if name_text and variants:
+                # Add variant type to first variant if not already present
+                variants[0]["Variant Type"] = name_text.strip()
 
         return variants
 
-    def _build_header_index_map(self, table) -> list[tuple[int, str]]:
+    def _build_header_index_map(self, header_texts: list[str]) -> list[tuple[int, str]]:
         """Build mapping of cell indices to cleaned header names.
 
         Note: First column is often a variant group identifier (e.g., "Kelly medium dome 60")
         so we keep it even if it looks like a variant name.
 
         Args:
-            table: Table element containing thead with header cells
+            header_texts: Raw text of the header row cells
 
         Returns:
             List of (index, cleaned_header_name) tuples
         """
         header_map = []
-        header_row = table.query_selector("thead tr")
-
-        if header_row:
-            header_cells = header_row.query_selector_all("th")
-            for idx, cell in enumerate(header_cells):
-                if cell.text_content():
-                    cleaned = clean_variant_header_name(cell.text_content())
-                    # Keep first column even if filtering would remove it (it's a grouping header)
-                    if cleaned or idx == 0:
-                        final_name = cleaned if cleaned else cell.text_content().strip()
-                        header_map.append((idx, final_name))
+
+        for idx, header_text in enumerate(header_texts):
+            if header_text:
+                cleaned = clean_variant_header_name(header_text)
+                # Keep first column even if filtering would remove it (it's a grouping header)
+                if cleaned or idx == 0:
+                    final_name = cleaned if cleaned else header_text.strip()
+                    header_map.append((idx, final_name))
 
         return header_map
 
     def _parse_variant_row(
-        self, row, header_map: list[tuple[int, str]]
+        self, cells: list[str], header_map: list[tuple[int, str]]
     ) -> dict[str, str]:
         """Parse a variant table row into attribute dictionary.
 
         Detects product codes (e.g., "14126 1000") and stores them as "Code".
 
         Args:
-            row: Table row element containing td cells
+            cells: Raw text of the row's td cells
             header_map: List of (cell_index, attribute_name) tuples
 
         Returns:
             Dictionary of attribute names to values, or empty dict if no data
         """
-        cells = row.query_selector_all("td")
         if not cells:
             return {}
 
@@ -1394,12 +1596,12 @@ class LodesScraper(BaseScraper):
         # Map cells to headers using the index mapping
         for cell_idx, attr_name in header_map:
             if cell_idx < len(cells):
-                attr_value = cells[cell_idx].text_content()
+                attr_value = cells[cell_idx]
                 if attr_value:
                     cleaned_value = attr_value.strip()
 
                     # Check if this value looks like a product code
-                    if re.match(self.PRODUCT_CODE_PATTERN, cleaned_value):
+                    if self.PRODUCT_CODE_RE.match(cleaned_value):
                         variant_data["Code"] = cleaned_value
                     else:
                         variant_data[attr_name] = cleaned_value
@@ -1408,8 +1610,7 @@ class LodesScraper(BaseScraper):
 
     def _is_product_image(self, src: str) -> bool:
         """Filter out non-product images (logos, icons, etc.)."""
-        src_lower = src.lower()
-        return not any(pattern in src_lower for pattern in self.IMAGE_EXCLUDE_PATTERNS)
+        return self.IMAGE_EXCLUDE_RE.search(src) is None
 
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format.
@@ -1439,10 +1640,5 @@ class LodesScraper(BaseScraper):
 
     def _get_full_resolution_url(self, src: str) -> str:
         """Convert thumbnail or scaled URLs to full resolution."""
-        # Remove common size suffixes
-        full_url = src.replace("-scaled", "")
-        full_url = full_url.replace("-150x150", "")
-        full_url = full_url.replace("-300x300", "")
-        full_url = full_url.replace("-1024x1024", "")
-
-        return full_url
+        # Remove common size suffixes in a single pass
+        return self.IMAGE_SIZE_SUFFIX_RE.sub("", src)
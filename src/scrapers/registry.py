@@ -1,23 +1,31 @@
 """Manufacturer scraper registry.
 
 Provides centralized mapping of manufacturer names to scraper classes.
-Adding a new manufacturer only requires adding an entry to SCRAPER_REGISTRY.
+Adding a new manufacturer only requires adding an entry to _SCRAPER_REGISTRY.
 """
 
-from typing import Type
+from types import MappingProxyType
+from typing import Mapping, Type
 
 from src.scrapers.base_scraper import BaseScraper
 from src.scrapers.lodes_scraper import LodesScraper
 from src.scrapers.vibia_scraper import VibiaScraper
 
 # Registry of available scrapers
-SCRAPER_REGISTRY: dict[str, Type[BaseScraper]] = {
+_SCRAPER_REGISTRY: dict[str, Type[BaseScraper]] = {
     "lodes": LodesScraper,
     "vibia": VibiaScraper,
     # Future manufacturers added here:
     # "flos": FlosScraper,
 }
 
+# Read-only public view; the registry is fixed at import time
+SCRAPER_REGISTRY: Mapping[str, Type[BaseScraper]] = MappingProxyType(_SCRAPER_REGISTRY)
+
+# Precomputed for error messages and listings
+_AVAILABLE_MANUFACTURERS = tuple(_SCRAPER_REGISTRY)
+_AVAILABLE_MANUFACTURERS_STR = ", ".join(_AVAILABLE_MANUFACTURERS)
+
 
 def get_scraper_class(manufacturer: str) -> Type[BaseScraper]:
     """Get scraper class for a manufacturer.
@@ -31,13 +39,14 @@ def get_scraper_class(manufacturer: str) -> Type[BaseScraper]:
     Raises:
         ValueError: If manufacturer is not supported
     """
-    if manufacturer not in SCRAPER_REGISTRY:
-        available = ", ".join(SCRAPER_REGISTRY.keys())
+    scraper_class = _SCRAPER_REGISTRY.get(manufacturer)
+    if scraper_class is None:
         raise ValueError(
-            f"Unknown manufacturer: {manufacturer}. Available: {available}"
+            f"Unknown manufacturer: {manufacturer}. "
+            f"Available: {_AVAILABLE_MANUFACTURERS_STR}"
         )
 
-    return SCRAPER_REGISTRY[manufacturer]
+    return scraper_class
 
 
 def get_available_manufacturers() -> list[str]:
@@ -46,4 +55,4 @@ def get_available_manufacturers() -> list[str]:
     Returns:
         List of manufacturer identifiers
     """
-    return list(SCRAPER_REGISTRY.keys())
+    return list(_AVAILABLE_MANUFACTURERS)
@@ -6,10 +6,21 @@ Following CLAUDE.md: unit tests for pure logic functions.
 import io
 import tempfile
 import zipfile
+from unittest.mock import MagicMock
 from pathlib import Path
 
+import httpx
 import pytest
-from src.scrapers.vibia_scraper import VibiaScraper
+from src import vibia_price_list
+from src.scrapers.vibia_scraper import (
+    COOKIE_ACCEPT_SELECTOR,
+    LOGIN_SESSION_TTL,
+    VibiaScraper,
+    _dig,
+    _image_type_hint,
+    _is_unsafe_zip_member,
+    _resolve_sku,
+)
 
 
 class TestExtractZipSafely:
@@ -30,7 +41,7 @@ class TestExtractZipSafely:
 
         # Extract safely
         with zipfile.ZipFile(zip_buffer, "r") as zip_ref:
-            scraper._extract_zip_safely(zip_ref, tmp_path)
+            assert scraper._extract_zip_safely(zip_ref, tmp_path) == 3
 
         # Verify files were extracted
         assert (tmp_path / "manual.pdf").exists()
@@ -131,6 +142,40 @@ class TestExtractZipSafely:
         with zipfile.ZipFile(zip_buffer, "r") as zip_ref:
             scraper._extract_zip_safely(zip_ref, tmp_path)
 
+    @pytest.mark.parametrize(
+        "filename, unsafe",
+        [
+            ("manual.pdf", False),
+            ("sub/folder/spec..v2.pdf", False),
+            ("../escape.pdf", True),
+            ("sub/../../escape.pdf", True),
+            ("..\\escape.pdf", True),
+            ("/etc/passwd", True),
+            ("\\server\\share\\x.pdf", True),
+            ("C:/Windows/x.pdf", True),
+        ],
+    )
+    def test_member_path_check(self, filename, unsafe):
+        """Should flag only names that can leave the target directory."""
+        assert _is_unsafe_zip_member(filename) is unsafe
+
+    def test_validates_all_members_before_extracting(self, tmp_path: Path):
+        """Should not write earlier members when a later one is unsafe."""
+        scraper = VibiaScraper()
+
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w") as zip_file:
+            zip_file.writestr("manual.pdf", b"PDF content")
+            zip_file.writestr("../escape.pdf", b"malicious")
+
+        zip_buffer.seek(0)
+
+        with zipfile.ZipFile(zip_buffer, "r") as zip_ref:
+            with pytest.raises(ValueError, match="ZIP contains unsafe path"):
+                scraper._extract_zip_safely(zip_ref, tmp_path)
+
+        assert not (tmp_path / "manual.pdf").exists()
+
 
 class TestExtractDownloadIds:
     """Unit tests for _extract_download_ids method."""
@@ -234,3 +279,738 @@ class TestExtractDownloadIds:
         result = scraper._extract_download_ids(feature_props)
 
         assert result["application_location_id"] == 100
+
+    def test_returns_none_when_collection_missing(self):
+        """Should return None when the collection object is absent."""
+        scraper = VibiaScraper()
+
+        result = scraper._extract_download_ids({"data": {"id": 809}})
+
+        assert result is None
+
+
+class TestFetchJsonViaHttp:
+    """Unit tests for the _fetch_json_via_http fast path."""
+
+    URL = "https://www.vibia.com/de/int/kollektionen/pendelleuchten-circus-pendelleuchte"
+
+    def _scraper_with_response(self, response: httpx.Response) -> VibiaScraper:
+        scraper = VibiaScraper()
+        scraper._http_client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: response)
+        )
+        return scraper
+
+    def test_parses_inlined_next_data(self):
+        """Should return the JSON embedded in the __NEXT_DATA__ script tag."""
+        html = (
+            '<html><script id="__NEXT_DATA__" type="application/json">'
+            '{"props": {"pageProps": {"id": 1}}}</script></html>'
+        )
+        scraper = self._scraper_with_response(httpx.Response(200, text=html))
+
+        status, json_data = scraper._fetch_json_via_http(self.URL)
+
+        assert status == 200
+        assert json_data == {"props": {"pageProps": {"id": 1}}}
+
+    def test_returns_none_without_script_tag(self):
+        """Should signal a browser fallback when the HTML has no payload."""
+        scraper = self._scraper_with_response(httpx.Response(200, text="<html></html>"))
+
+        assert scraper._fetch_json_via_http(self.URL) == (200, None)
+
+    def test_returns_none_for_invalid_json(self):
+        """Should fall back to the browser when the payload does not parse."""
+        html = '<script id="__NEXT_DATA__" type="application/json">{"props": </script>'
+        scraper = self._scraper_with_response(httpx.Response(200, text=html))
+
+        assert scraper._fetch_json_via_http(self.URL) == (200, None)
+
+    def test_parses_non_ascii_payload(self):
+        """Should decode UTF-8 payloads straight from the response bytes."""
+        html = '<script id="__NEXT_DATA__">{"name": "Größe Ø 20 cm"}</script>'
+        scraper = self._scraper_with_response(
+            httpx.Response(200, content=html.encode("utf-8"))
+        )
+
+        assert scraper._fetch_json_via_http(self.URL) == (200, {"name": "Größe Ø 20 cm"})
+
+    def test_returns_status_for_missing_page(self):
+        """Should report 404 so the caller can skip the language."""
+        scraper = self._scraper_with_response(httpx.Response(404))
+
+        assert scraper._fetch_json_via_http(self.URL) == (404, None)
+
+
+class TestNextLanguageFallback:
+    """Unit tests for fetching the next language while the browser renders."""
+
+    DE_URL = "https://www.vibia.com/de/int/lamp"
+    EN_URL = "https://www.vibia.com/en/int/lamp"
+    EN_HTML = (
+        '<script id="__NEXT_DATA__">'
+        '{"props": {"pageProps": {"featureProps": {"id": 1}}}}</script>'
+    )
+
+    def test_next_language_fetched_during_browser_fallback(self, monkeypatch):
+        """Should start the next language's HTTP fetch before rendering."""
+        scraper = VibiaScraper()
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            html = self.EN_HTML if str(request.url) == self.EN_URL else "<html></html>"
+            return httpx.Response(200, text=html)
+
+        def render(url):
+            # The English page is already on its way when the browser starts
+            assert self.EN_URL in scraper._pending_json
+            return None
+
+        scraper._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(
+            scraper,
+            "build_product_url",
+            lambda sku, language="de": f"https://www.vibia.com/{language}/int/{sku}",
+        )
+        monkeypatch.setattr(scraper, "_fetch_json_via_browser", render)
+        parse = MagicMock(return_value=[])
+        monkeypatch.setattr(scraper, "_parse_product_data", parse)
+
+        with pytest.raises(Exception, match="all languages"):
+            scraper.scrape_product("lamp")
+
+        assert sorted(requested) == [self.DE_URL, self.EN_URL]
+        parse.assert_called_once_with({"id": 1}, "lamp", "en")
+        assert scraper._pending_json == {}
+
+
+class TestLoginSession:
+    """Unit tests for reusing the authenticated API session."""
+
+    class FakeAuth:
+        instances = []
+
+        def __init__(self, email, password):
+            self.logins = 0
+            self.closed = False
+            self.auth_token = None
+            self.client = httpx.Client()
+            self.client.cookies.set("vibia_jwt", "token", domain="api.vibia.com")
+            TestLoginSession.FakeAuth.instances.append(self)
+
+        def login(self):
+            self.logins += 1
+            self.auth_token = "token"
+            return True
+
+        def logout(self):
+            self.closed = True
+            self.client.close()
+
+    @pytest.fixture
+    def scraper(self, monkeypatch):
+        monkeypatch.setenv("VIBIA_EMAIL", "test@test.com")
+        monkeypatch.setenv("VIBIA_PASSWORD", "secret")
+        monkeypatch.setattr("src.scrapers.vibia_scraper.VibiaAuth", self.FakeAuth)
+        self.FakeAuth.instances = []
+        scraper = VibiaScraper()
+        scraper._page = MagicMock()
+        monkeypatch.setattr(scraper, "_ensure_browser", lambda: None)
+        return scraper
+
+    def test_logs_in_once_across_products(self, scraper):
+        """Should reuse one authenticated client for every product download."""
+        assert scraper._login_and_inject_cookies()
+        assert scraper._login_and_inject_cookies()
+
+        assert len(self.FakeAuth.instances) == 1
+        assert self.FakeAuth.instances[0].logins == 1
+        assert scraper._page.context.add_cookies.call_count == 2
+
+    def test_injected_cookie_domains(self, scraper):
+        """Should widen vibia.com cookies to .vibia.com and keep other domains."""
+        scraper._login_and_inject_cookies()
+        jar = self.FakeAuth.instances[0].client.cookies
+        jar.set("cdn", "x", domain="cdn.example.com", path="/assets")
+        jar.set("empty", "", domain="api.vibia.com")
+        scraper._login_and_inject_cookies()
+
+        cookies = scraper._page.context.add_cookies.call_args.args[0]
+        assert sorted(cookies, key=lambda c: c["name"]) == [
+            {"name": "cdn", "value": "x", "domain": "cdn.example.com", "path": "/assets"},
+            {"name": "vibia_jwt", "value": "token", "domain": ".vibia.com", "path": "/"},
+        ]
+
+    def test_logs_in_again_after_session_ttl(self, scraper, monkeypatch):
+        """Should refresh the login once the cached session is too old."""
+        clock = iter([1000.0, 1001.0, 1000.0 + LOGIN_SESSION_TTL + 1, 0])
+        monkeypatch.setattr("src.scrapers.vibia_scraper.time.monotonic", lambda: next(clock))
+
+        scraper._login_and_inject_cookies()
+        scraper._login_and_inject_cookies()
+        scraper._login_and_inject_cookies()
+
+        assert self.FakeAuth.instances[0].logins == 2
+
+    def test_teardown_closes_session(self, scraper):
+        """Should close the API session together with the browser context."""
+        scraper._login_and_inject_cookies()
+        scraper._page = None
+
+        scraper.teardown_browser()
+
+        assert self.FakeAuth.instances[0].closed
+        assert scraper._vibia_auth is None
+
+
+class TestPrefetchProducts:
+    """Unit tests for concurrent __NEXT_DATA__ prefetching."""
+
+    HTML = (
+        '<html><script id="__NEXT_DATA__" type="application/json">'
+        '{"props": {}}</script></html>'
+    )
+
+    @pytest.fixture
+    def scraper(self, monkeypatch):
+        scraper = VibiaScraper()
+        self.requested = []
+
+        def handler(request):
+            self.requested.append(str(request.url))
+            return httpx.Response(200, text=self.HTML)
+
+        scraper._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(
+            scraper,
+            "build_product_url",
+            lambda sku, language="de": f"https://www.vibia.com/{language}/int/{sku}",
+        )
+        return scraper
+
+    def test_fetches_each_sku_once_in_priority_language(self, scraper):
+        """Should fetch one first-language page per SKU and keep the results."""
+        scraper.prefetch_products(["a", "b", "c"])
+
+        assert sorted(self.requested) == [
+            "https://www.vibia.com/de/int/a",
+            "https://www.vibia.com/de/int/b",
+            "https://www.vibia.com/de/int/c",
+        ]
+        assert scraper._prefetched_json["https://www.vibia.com/de/int/b"] == (
+            200,
+            {"props": {}},
+        )
+
+    def test_next_window_replaces_previous_results(self, scraper):
+        """Should drop the previous window's pages when a new window starts."""
+        scraper.prefetch_products(["a"])
+        scraper.prefetch_products(["b"])
+
+        assert list(scraper._prefetched_json) == ["https://www.vibia.com/de/int/b"]
+
+    def test_skus_sharing_a_page_fetch_it_once(self, scraper, monkeypatch):
+        """Should request a shared product page once for all its SKUs."""
+        # Real URL building: the model, a variant SKU and the slug share a page
+        monkeypatch.delattr(scraper, "build_product_url")
+        html = (
+            '<script id="__NEXT_DATA__">'
+            '{"props": {"pageProps": {"featureProps": {"id": 1}}}}</script>'
+        )
+        scraper._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: self.requested.append(str(request.url))
+                or httpx.Response(200, text=html)
+            )
+        )
+        parse = MagicMock(return_value=[MagicMock()])
+        monkeypatch.setattr(scraper, "_parse_product_data", parse)
+        monkeypatch.setattr(scraper, "download_product_files", MagicMock())
+        skus = ["0162", "0162/1", "circus"]
+
+        scraper.prefetch_products(skus)
+        for sku in skus:
+            scraper.scrape_product(sku)
+
+        assert self.requested == [scraper.build_product_url("circus", "de")]
+        assert parse.call_count == 3
+
+    def test_skips_skus_without_url(self, scraper, monkeypatch):
+        """Should ignore SKUs that cannot be mapped to a product URL."""
+
+        def build(sku, language="de"):
+            raise ValueError(sku)
+
+        monkeypatch.setattr(scraper, "build_product_url", build)
+
+        scraper.prefetch_products(["unknown"])
+
+        assert self.requested == []
+        assert scraper._prefetched_json == {}
+
+
+class TestExtractJsonData:
+    """Unit tests for reading featureProps from a rendered page."""
+
+    def test_returns_feature_props_projection(self):
+        """Should return the featureProps subtree evaluated in the page."""
+        page = MagicMock()
+        page.evaluate.return_value = {"data": {"name": "Circus"}}
+
+        result = VibiaScraper()._extract_json_data(page)
+
+        assert result == {"data": {"name": "Circus"}}
+        assert "featureProps" in page.evaluate.call_args[0][0]
+
+    def test_json_ld_only_page_yields_empty_feature_props(self):
+        """Should fall back to the price list when only JSON-LD is present."""
+        page = MagicMock()
+        page.evaluate.return_value = {}
+
+        assert VibiaScraper()._extract_json_data(page) == {}
+        assert "ld+json" in page.evaluate.call_args[0][0]
+
+    def test_returns_none_without_product_data(self):
+        """Should signal a missing page when neither source is present."""
+        page = MagicMock()
+        page.evaluate.return_value = None
+
+        assert VibiaScraper()._extract_json_data(page) is None
+
+    def test_single_evaluate_round_trip(self):
+        """Should check __NEXT_DATA__ and JSON-LD in one page.evaluate call."""
+        page = MagicMock()
+        page.evaluate.return_value = None
+
+        VibiaScraper()._extract_json_data(page)
+
+        page.evaluate.assert_called_once()
+
+    def test_evaluate_error_returns_none(self):
+        """Should treat a failed evaluation as a page without product data."""
+        page = MagicMock()
+        page.evaluate.side_effect = RuntimeError("page closed")
+
+        assert VibiaScraper()._extract_json_data(page) is None
+
+
+class TestDig:
+    """Unit tests for the nested key path helper."""
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ({"a": {"b": {"c": 1}}}, 1),
+            ({"a": {"b": {}}}, "default"),
+            ({"a": {"b": None}}, "default"),
+            ({"a": ["not", "a", "dict"]}, "default"),
+            (None, "default"),
+        ],
+    )
+    def test_walks_path_or_returns_default(self, data, expected):
+        """Should follow dict keys and fall back on any missing level."""
+        assert _dig(data, ("a", "b", "c"), "default") == expected
+
+
+class TestResolveSku:
+    """Unit tests for single-pass SKU resolution."""
+
+    MODEL, PRODUCT = next(iter(vibia_price_list.PRODUCTS.items()))
+
+    @pytest.mark.parametrize("suffix", ["", "/1", " 10 / 1A _ 18"])
+    def test_structured_skus_resolve_model_and_slug(self, suffix):
+        """Should map every SKU format to its model and price list slug."""
+        assert _resolve_sku(f"{self.MODEL}{suffix}") == (
+            self.MODEL,
+            self.PRODUCT["url_slug"],
+        )
+
+    def test_slug_passes_through(self):
+        """Should treat lowercase slugs as already resolved."""
+        assert _resolve_sku("circus") == (None, "circus")
+
+    def test_slug_with_trailing_newline_is_rejected(self):
+        """Should not let a newline-terminated slug into the product URL."""
+        assert _resolve_sku("circus\n") == (None, None)
+
+    @pytest.mark.parametrize("sku, expected", [("9999", ("9999", None)), ("X1", (None, None))])
+    def test_unknown_skus(self, sku, expected):
+        """Should keep the model for unknown numbers and give up otherwise."""
+        assert _resolve_sku(sku) == expected
+
+    def test_base_sku_matches_model(self):
+        """Should return the model for structured SKUs."""
+        assert VibiaScraper()._get_base_sku(f"{self.MODEL}/1") == self.MODEL
+
+
+class TestExtractAndProcessZip:
+    """Unit tests for nested ZIP handling."""
+
+    @staticmethod
+    def _zip_bytes(members: dict[str, bytes]) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zip_file:
+            for name, content in members.items():
+                zip_file.writestr(name, content)
+        return buffer.getvalue()
+
+    def test_extracts_nested_zip_members(self, tmp_path: Path):
+        """Should unpack top-level nested ZIPs and remove them afterwards."""
+        inner = self._zip_bytes({"photo.jpg": b"jpg"})
+        outer = tmp_path / "product_images.zip"
+        outer.write_bytes(self._zip_bytes({"inner.ZIP": inner, "spec.pdf": b"pdf"}))
+        out = tmp_path / "images"
+
+        count = VibiaScraper()._extract_and_process_zip(outer, out)
+
+        assert count == 3
+        assert (out / "photo.jpg").read_bytes() == b"jpg"
+        assert not (out / "inner.ZIP").exists()
+        assert not outer.exists()
+
+    def test_keeps_invalid_nested_zip_as_file(self, tmp_path: Path):
+        """Should write a nested .zip that is not an archive out unchanged."""
+        outer = tmp_path / "product_images.zip"
+        outer.write_bytes(self._zip_bytes({"broken.zip": b"not a zip"}))
+        out = tmp_path / "images"
+
+        count = VibiaScraper()._extract_and_process_zip(outer, out)
+
+        assert count == 1
+        assert (out / "broken.zip").read_bytes() == b"not a zip"
+
+    def test_keeps_nested_zip_that_fails_validation(self, tmp_path: Path):
+        """Should write an unsafe nested archive out untouched for manual handling."""
+        inner = self._zip_bytes({"../escape.jpg": b"jpg"})
+        outer = tmp_path / "product_images.zip"
+        outer.write_bytes(self._zip_bytes({"unsafe.zip": inner, "spec.pdf": b"pdf"}))
+        out = tmp_path / "images"
+
+        VibiaScraper()._extract_and_process_zip(outer, out)
+
+        assert (out / "unsafe.zip").read_bytes() == inner
+        assert (out / "spec.pdf").read_bytes() == b"pdf"
+        assert not (tmp_path / "escape.jpg").exists()
+
+    def test_ignores_zips_already_in_output_dir(self, tmp_path: Path):
+        """Should only touch ZIPs that came out of this archive."""
+        out = tmp_path / "images"
+        out.mkdir()
+        leftover = out / "leftover.zip"
+        leftover.write_bytes(b"not a zip")
+        outer = tmp_path / "ambient_images.zip"
+        outer.write_bytes(self._zip_bytes({"room.jpg": b"jpg"}))
+
+        count = VibiaScraper()._extract_and_process_zip(outer, out)
+
+        assert count == 1
+        assert leftover.read_bytes() == b"not a zip"
+
+
+class TestTextListExtraction:
+    """Unit tests for description and breadcrumb list flattening."""
+
+    def test_description_joins_paragraphs_and_strings(self):
+        """Should keep non-empty paragraphs and plain strings in order."""
+        data = {
+            "technicalInfo": {
+                "description": [
+                    {"paragraph": "First"},
+                    {"paragraph": ""},
+                    {"other": "ignored"},
+                    "Second",
+                    42,
+                ]
+            }
+        }
+
+        assert VibiaScraper()._extract_description(data) == "First\n\nSecond"
+
+    def test_categories_from_breadcrumb_and_collection(self):
+        """Should collect breadcrumb texts and append the collection family."""
+        feature_props = {
+            "data": {
+                "hero": {
+                    "applicationBreadcrumb": [
+                        {"text": "Indoor"},
+                        {"text": None},
+                        "Pendelleuchten",
+                    ]
+                }
+            },
+            "collection": {"family": "Circus"},
+        }
+
+        assert VibiaScraper()._extract_categories_from_feature_props(feature_props) == [
+            "Indoor",
+            "Pendelleuchten",
+            "Circus",
+        ]
+
+
+class TestExtractImages:
+    """Unit tests for product image extraction."""
+
+    def test_stops_at_max_images(self):
+        """Should collect at most MAX_IMAGES strapiMedia entries, in order."""
+        scraper = VibiaScraper()
+        media = [{"url": f"/uploads/{i}.jpg"} for i in range(scraper.MAX_IMAGES + 5)]
+
+        images = scraper._extract_images({"strapiMedia": media})
+
+        assert len(images) == scraper.MAX_IMAGES
+        assert images[0] == "https://www.vibia.com/uploads/0.jpg"
+        assert images[-1] == f"https://www.vibia.com/uploads/{scraper.MAX_IMAGES - 1}.jpg"
+
+    def test_prefers_first_hero_image(self):
+        """Should take only the first available hero rendition."""
+        data = {
+            "hero": {"media": {"tablet": {"url": "//cdn.vibia.com/t.jpg"}}},
+            "strapiMedia": [{"url": "/uploads/0.jpg"}],
+        }
+
+        assert VibiaScraper()._extract_images(data) == ["https://cdn.vibia.com/t.jpg"]
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("//cdn.vibia.com/a.jpg", "https://cdn.vibia.com/a.jpg"),
+            ("/uploads/a.jpg", "https://www.vibia.com/uploads/a.jpg"),
+            ("https://cdn.vibia.com/a.jpg", "https://cdn.vibia.com/a.jpg"),
+        ],
+    )
+    def test_absolute_url(self, url, expected):
+        """Should complete protocol- and site-relative URLs only."""
+        assert VibiaScraper()._absolute_url(url) == expected
+
+
+class TestBuildProductUrl:
+    """Unit tests for product URL construction from the price list."""
+
+    @pytest.mark.parametrize(
+        "sku, language, expected",
+        [
+            (
+                "0162",
+                "de",
+                "https://www.vibia.com/de/int/kollektionen/pendelleuchten-circus-pendelleuchte",
+            ),
+            (
+                "0162/1",
+                "en",
+                "https://www.vibia.com/en/int/collections/hanging-lamps-circus-hanging",
+            ),
+            (
+                "circus",
+                "en",
+                "https://www.vibia.com/en/int/collections/hanging-lamps-circus-hanging",
+            ),
+        ],
+    )
+    def test_builds_localised_url(self, sku, language, expected):
+        """Should combine category, slug and type from one price list entry."""
+        assert VibiaScraper().build_product_url(sku, language) == expected
+
+    def test_unknown_slug_uses_pendant_defaults(self):
+        """Should fall back to the pendant category and type for unknown slugs."""
+        assert VibiaScraper().build_product_url("unknown-lamp", "de") == (
+            "https://www.vibia.com/de/int/kollektionen/"
+            "pendelleuchten-unknown-lamp-pendelleuchte"
+        )
+
+
+class TestClassifyAndOrganizeImages:
+    """Unit tests for concurrent image classification."""
+
+    def test_numbers_images_in_discovery_order(self, tmp_path: Path, monkeypatch):
+        """Should rename by classification while keeping the original order."""
+        monkeypatch.setattr(
+            "src.scrapers.vibia_scraper.CLASSIFY_REQUEST_INTERVAL", 0
+        )
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(
+            "src.ai.image_classifier.classify_image_file",
+            lambda path: "product" if "studio" in path else "project",
+        )
+        for name in ["a_studio.jpg", "b_room.jpg", "c_studio.png", "d_room.jpg"]:
+            (tmp_path / name).write_bytes(name.encode())
+
+        VibiaScraper()._classify_and_organize_images(tmp_path)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "product_00.jpg",
+            "product_01.png",
+            "project_00.jpg",
+            "project_01.jpg",
+        ]
+
+    def test_moves_images_out_of_subdirectories(self, tmp_path: Path, monkeypatch):
+        """Should move nested images into images_dir and drop the empty folder."""
+        monkeypatch.setattr(
+            "src.scrapers.vibia_scraper.CLASSIFY_REQUEST_INTERVAL", 0
+        )
+        monkeypatch.setattr(
+            "src.ai.image_classifier.classify_image_file", lambda path: "project"
+        )
+        nested = tmp_path / "Ambient"
+        nested.mkdir()
+        (nested / "room.JPG").write_bytes(b"room")
+
+        VibiaScraper()._classify_and_organize_images(tmp_path)
+
+        assert (tmp_path / "project_00.jpg").read_bytes() == b"room"
+        assert not nested.exists()
+
+    def test_without_api_key_uses_cached_classifications(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """Should still serve cached classifications and skip the rate limit."""
+        from src.ai import image_classifier
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setattr(image_classifier, "CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(
+            "src.scrapers.vibia_scraper.time.sleep",
+            MagicMock(side_effect=AssertionError("rate limit without API key")),
+        )
+        images_dir = tmp_path / "images"
+        images_dir.mkdir()
+        cached = images_dir / "cached.jpg"
+        cached.write_bytes(b"cached")
+        (images_dir / "loose.jpg").write_bytes(b"loose")
+        image_classifier._save_to_cache(
+            image_classifier._get_cache_key(str(cached)), "product", str(cached)
+        )
+
+        VibiaScraper()._classify_and_organize_images(images_dir)
+
+        assert (images_dir / "product_00.jpg").read_bytes() == b"cached"
+        assert (images_dir / "project_00.jpg").read_bytes() == b"loose"
+
+
+class TestSaveDownload:
+    """Unit tests for moving finished browser downloads into place."""
+
+    def test_renames_staged_download(self, tmp_path: Path):
+        """Should move the staged file instead of copying it."""
+        staged = tmp_path / "staged"
+        staged.write_bytes(b"zip")
+        download = MagicMock()
+        download.path.return_value = str(staged)
+
+        VibiaScraper._save_download(download, tmp_path / "product_images.zip")
+
+        assert (tmp_path / "product_images.zip").read_bytes() == b"zip"
+        assert not staged.exists()
+        download.save_as.assert_not_called()
+
+    def test_copies_when_rename_fails(self, tmp_path: Path, monkeypatch):
+        """Should fall back to save_as across filesystems."""
+
+        def cross_device(src, dst):
+            raise OSError("Invalid cross-device link")
+
+        monkeypatch.setattr("src.scrapers.vibia_scraper.os.replace", cross_device)
+        download = MagicMock()
+        target = tmp_path / "spec.pdf"
+
+        VibiaScraper._save_download(download, target)
+
+        download.save_as.assert_called_once_with(target)
+
+
+class TestImageTypeHint:
+    """Unit tests for folder-name image type hints."""
+
+    @pytest.mark.parametrize(
+        "relative, expected",
+        [
+            ("photo.jpg", None),
+            ("Product Images/photo.jpg", "product"),
+            ("0162_ficha/photo.jpg", "product"),
+            ("Ambient/photo.jpg", "project"),
+            ("renders/Lifestyle_2024/photo.jpg", "project"),
+            ("misc/photo.jpg", None),
+            ("product/ambient/photo.jpg", None),
+            ("reproduction/photo.jpg", None),
+        ],
+    )
+    def test_hint_from_folders_below_images_dir(self, tmp_path: Path, relative, expected):
+        """Should only trust unambiguous folder names inside the archive."""
+        images_dir = tmp_path / "product_output" / "images"
+
+        assert _image_type_hint(images_dir / relative, images_dir) == expected
+
+    def test_hinted_images_skip_classifier(self, tmp_path: Path, monkeypatch):
+        """Should only send unhinted images to the AI classifier."""
+        monkeypatch.setattr("src.scrapers.vibia_scraper.CLASSIFY_REQUEST_INTERVAL", 0)
+        classified = []
+
+        def classify(path):
+            classified.append(Path(path).name)
+            return "product"
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr("src.ai.image_classifier.classify_image_file", classify)
+        (tmp_path / "Ambient").mkdir()
+        (tmp_path / "Ambient" / "room.jpg").write_bytes(b"room")
+        (tmp_path / "loose.jpg").write_bytes(b"loose")
+
+        VibiaScraper()._classify_and_organize_images(tmp_path)
+
+        assert classified == ["loose.jpg"]
+        assert (tmp_path / "project_00.jpg").read_bytes() == b"room"
+        assert (tmp_path / "product_00.jpg").read_bytes() == b"loose"
+
+
+class TestRemoveDuplicateImages:
+    """Unit tests for content-based duplicate removal."""
+
+    def test_drops_byte_identical_copies(self, tmp_path: Path):
+        """Should keep the first copy and delete later identical ones."""
+        (tmp_path / "product_00.jpg").write_bytes(b"known")
+        (tmp_path / "lamp.jpg").write_bytes(b"lamp")
+        (tmp_path / "lamp-copy.jpg").write_bytes(b"lamp")
+        (tmp_path / "redownload.jpg").write_bytes(b"known")
+        (tmp_path / "other.jpg").write_bytes(b"other")
+        image_files = sorted(tmp_path.iterdir())
+        candidates = [p for p in image_files if not p.name.startswith("product_")]
+
+        unique = VibiaScraper()._remove_duplicate_images(image_files, candidates)
+
+        assert [p.name for p in unique] == ["lamp-copy.jpg", "other.jpg"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "lamp-copy.jpg",
+            "other.jpg",
+            "product_00.jpg",
+        ]
+
+
+class TestDismissCookieBanner:
+    """Unit tests for _dismiss_cookie_banner."""
+
+    def test_queries_all_selectors_in_one_locator(self):
+        """Should probe the combined selector once and click the visible button."""
+        scraper = VibiaScraper()
+        scraper._page = MagicMock()
+        btn = scraper._page.locator.return_value.first
+        btn.is_visible.return_value = True
+
+        scraper._dismiss_cookie_banner()
+
+        scraper._page.locator.assert_called_once_with(COOKIE_ACCEPT_SELECTOR)
+        btn.click.assert_called_once()
+        btn.wait_for.assert_called_once()
+
+    def test_no_click_when_banner_absent(self):
+        """Should not click anything when no accept button is visible."""
+        scraper = VibiaScraper()
+        scraper._page = MagicMock()
+        btn = scraper._page.locator.return_value.first
+        btn.is_visible.return_value = False
+
+        scraper._dismiss_cookie_banner()
+
+        btn.click.assert_not_called()
@@ -4,26 +4,201 @@ Following CLAUDE.md: manufacturer-specific logic only, inherits common functiona
 Vibia uses Next.js with JSON-LD embedded data, requiring different extraction approach than Lodes.
 """
 
+import hashlib
+import io
 import os
 import re
+import time
 import zipfile
-from pathlib import Path
-from typing import Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path, PureWindowsPath
+from typing import Any, Callable, Optional
 
+import httpx
+import orjson
 from loguru import logger
-from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import Download, Page, TimeoutError as PlaywrightTimeout
 
 from src.scrapers.base_scraper import BaseScraper
+from src.utils.retry_handler import retry_with_backoff
 from src.models import SKU, ImageUrl, Manufacturer, ProductData, ScraperConfig
 from src import vibia_price_list
 from src.auth import VibiaAuth
 
 # Download modal interaction timeouts (milliseconds)
 MODAL_OPEN_TIMEOUT = 10000  # Wait for modal dialog to appear
-MODAL_ANIMATION_DELAY = 2000  # Wait for modal animation to complete
 DOWNLOAD_BUTTON_TIMEOUT = 10000  # Wait for download buttons to be visible
 DOWNLOAD_CLICK_DELAY = 1000  # Delay between download clicks
-PAGE_LOAD_DELAY = 2000  # Wait for page to fully load after navigation
+MODAL_DISMISS_TIMEOUT = 2000  # Wait for a dismissed modal/banner button to disappear
+
+# Cookiebot accept buttons, combined into one locator (":visible" so that .first
+# never lands on a hidden match that precedes the visible one in the DOM)
+COOKIE_ACCEPT_SELECTOR = ", ".join(
+    f"{selector}:visible"
+    for selector in (
+        "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
+        "#CybotCookiebotDialogBodyButtonAccept",
+        'button:has-text("Accept all")',
+        'button:has-text("Allow all")',
+        'button:has-text("Alle akzeptieren")',
+    )
+)
+
+LOGIN_SESSION_TTL = 1800  # seconds before the cached API login is refreshed
+VIBIA_COOKIE_DOMAIN = ".vibia.com"  # Injected cookie domain, valid on all subdomains
+
+# Image files picked up from extracted download ZIPs (matched case-insensitively)
+IMAGE_FILE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+CLASSIFY_WORKERS = 4  # Concurrent vision API requests when classifying images
+CLASSIFY_REQUEST_INTERVAL = 0.5  # seconds between request starts (shared by all workers)
+
+# Product page navigation retries on timeout before falling back to next language
+GOTO_RETRIES = 1
+GOTO_RETRY_DELAY = 0.5  # seconds, doubled per retry
+NEXT_DATA_TIMEOUT = 5000  # Wait for the inlined __NEXT_DATA__ script after DOMContentLoaded
+PREFETCH_WORKERS = 5  # Concurrent HTTP fetches of __NEXT_DATA__ when prefetching a batch
+
+# Server-rendered Next.js payload, read straight from the raw HTML bytes on the
+# HTTP fast path (orjson parses UTF-8 bytes without a str decode)
+_NEXT_DATA_RE = re.compile(
+    rb'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+
+# SKU shapes: a bare URL slug, or a SKU that starts with a 4-digit model number
+_SLUG_RE = re.compile(r"^[a-z-]+\Z")  # \Z: "$" would also accept a trailing newline
+_MODEL_RE = re.compile(r"^(\d{4})")
+
+
+@lru_cache(maxsize=4096)
+def _resolve_sku(sku: str) -> tuple[str | None, str | None]:
+    """Resolve a SKU to its model number and URL slug in one pass.
+
+    Every structured SKU format starts with the 4-digit model, so one regex
+    covers what parse_sku_components() would extract as "model".
+
+    Args:
+        sku: Model number, simplified/full SKU, or URL slug
+
+    Returns:
+        Tuple of (model number or None, URL slug or None)
+    """
+    if _SLUG_RE.match(sku):
+        return None, sku
+
+    model_match = _MODEL_RE.match(sku)
+    if not model_match:
+        return None, None
+
+    model = model_match.group(1)
+    product = vibia_price_list.get_product_by_model(model)
+    return model, product["url_slug"] if product else None
+
+
+def _is_unsafe_zip_member(filename: str) -> bool:
+    """Check whether a ZIP member name could escape the extraction directory.
+
+    Args:
+        filename: Member name as stored in the archive
+
+    Returns:
+        True for absolute paths, drive-qualified paths and ".." components
+    """
+    name = filename.replace("\\", "/")
+    return (
+        name.startswith("/")
+        or bool(PureWindowsPath(name).drive)
+        or ".." in name.split("/")
+    )
+
+
+# Folder names in extracted image archives that reveal the image type
+_PRODUCT_DIR_RE = re.compile(r"(?<![a-z])(?:product|producto|ficha)", re.IGNORECASE)
+_PROJECT_DIR_RE = re.compile(
+    r"(?<![a-z])(?:ambient|ambiente|project|inspiration|lifestyle)", re.IGNORECASE
+)
+
+
+def _file_digest(path: Path) -> bytes:
+    """Hash a file's contents for duplicate detection.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        BLAKE2b digest of the file bytes
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").digest()
+
+
+def _image_type_hint(image_file: Path, images_dir: Path) -> str | None:
+    """Infer an image's type from the archive folders it was extracted into.
+
+    Only folders below images_dir are considered, so the output path itself
+    (which may contain words like "product") never counts.
+
+    Args:
+        image_file: Extracted image path
+        images_dir: Root directory the archives were extracted into
+
+    Returns:
+        "product" or "project" when a folder name is unambiguous, else None
+    """
+    folders = image_file.parent.relative_to(images_dir).as_posix()
+    if folders == ".":
+        return None
+
+    is_product = bool(_PRODUCT_DIR_RE.search(folders))
+    is_project = bool(_PROJECT_DIR_RE.search(folders))
+    if is_product == is_project:
+        return None
+    return "product" if is_product else "project"
+
+
+def _load_image_classifier() -> Callable[[str], str] | None:
+    """Return the AI image classifier, or None when it is not installed.
+
+    Returns:
+        classify_image_file, or None if the classifier dependencies are missing
+    """
+    try:
+        # Import here to avoid circular dependency
+        from src.ai.image_classifier import classify_image_file
+    except ImportError:
+        return None
+    return classify_image_file
+
+
+# Key paths into __NEXT_DATA__ / featureProps, walked with _dig()
+_FEATURE_PROPS = ("props", "pageProps", "featureProps")
+_DATA_NAME = ("data", "name")
+_TECH_DESCRIPTION = ("technicalInfo", "description")
+_HERO_MEDIA = ("hero", "media")
+_HERO_BREADCRUMB = ("data", "hero", "applicationBreadcrumb")
+_LARGE_URL = ("large", "url")
+_MEDIUM_URL = ("medium", "url")
+
+
+def _dig(data: Any, path: tuple[str, ...], default: Any = None) -> Any:
+    """Walk nested dictionaries along a key path.
+
+    Args:
+        data: Root object, usually a dict parsed from JSON
+        path: Keys to follow in order
+        default: Value returned when a key is missing or a level is not a dict
+
+    Returns:
+        Value at the end of the path, or default
+    """
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
 
 # Language-specific URL path translations
 # German terms are stored in price list, need English equivalents for EN URLs
@@ -72,6 +247,8 @@ URL_PATH_TRANSLATIONS = {
 class VibiaScraper(BaseScraper):
     """Scraper for Vibia.com product pages."""
 
+    MAX_IMAGES = 10
+
     def __init__(self):
         """Initialize Vibia scraper with default configuration."""
         config = ScraperConfig(
@@ -84,6 +261,59 @@ class VibiaScraper(BaseScraper):
             default_price=0.0,
         )
         super().__init__(config)
+        self._vibia_auth: VibiaAuth | None = None
+        self._login_time = 0.0
+        self._prefetched_json: dict[str, tuple[int | None, dict[str, Any] | None]] = {}
+        # Next-language HTTP fetches running while the browser renders a page
+        self._pending_json: dict[str, Future] = {}
+        self._fallback_executor: ThreadPoolExecutor | None = None
+
+    def teardown_browser(self) -> None:
+        """Close the browser context and the authenticated API session."""
+        if self._vibia_auth:
+            self._vibia_auth.logout()
+            self._vibia_auth = None
+        self._prefetched_json.clear()
+        self._pending_json.clear()
+        if self._fallback_executor:
+            self._fallback_executor.shutdown(wait=False, cancel_futures=True)
+            self._fallback_executor = None
+        super().teardown_browser()
+
+    def prefetch_products(self, skus: list[SKU]) -> None:
+        """Fetch __NEXT_DATA__ for a batch of SKUs concurrently over HTTP.
+
+        Only the first-priority language is prefetched. Results stay cached
+        until the next window so SKUs that share a product page (model,
+        variant SKUs and slug all map to one URL) are served by one request;
+        scrape_product falls back to fetching itself for anything missing.
+
+        Args:
+            skus: SKUs that will be passed to scrape_product next
+        """
+        # A new window replaces the previous one
+        self._prefetched_json.clear()
+
+        language = (self.config.language_priority or ["de"])[0]
+        urls = []
+        for sku in skus:
+            try:
+                urls.append(self.build_product_url(sku, language))
+            except ValueError:
+                continue
+        # Variants of one product share its page; request each page once
+        urls = list(dict.fromkeys(urls))
+
+        if not urls:
+            return
+
+        # Create the client up front so worker threads share one connection pool
+        self.get_http_client()
+        with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as executor:
+            for url, result in zip(urls, executor.map(self._fetch_json_via_http, urls)):
+                self._prefetched_json[url] = result
+
+        logger.debug(f"Prefetched {len(urls)} Vibia product page(s)")
 
     def build_product_url(self, sku: SKU, language: str = "de") -> str:
         """Construct product URL from SKU with language support.
@@ -107,19 +337,19 @@ class VibiaScraper(BaseScraper):
         if not slug:
             raise ValueError(f"Could not determine product slug from SKU: {sku}")
 
-        # Get category prefix from price list (stored in German)
-        category_de = vibia_price_list.get_category_for_slug(slug)
+        # Category prefix and product type suffix both come from the first
+        # price list entry for the slug (stored in German)
+        products = vibia_price_list.get_product_by_slug(slug)
+        product = products[0] if products else None
+
+        category_de = product["category_prefix"] if product else None
         if not category_de:
             logger.warning(
                 f"No category found for slug '{slug}', using default 'pendelleuchten'"
             )
             category_de = "pendelleuchten"
 
-        # Get product type suffix from price list (stored in German)
-        products = vibia_price_list.get_product_by_slug(slug)
-        product_type_de = (
-            products[0]["product_type_suffix"] if products else "pendelleuchte"
-        )
+        product_type_de = product["product_type_suffix"] if product else "pendelleuchte"
 
         # Get language-specific path translations
         lang_paths = URL_PATH_TRANSLATIONS.get(language, URL_PATH_TRANSLATIONS["en"])
@@ -139,27 +369,7 @@ class VibiaScraper(BaseScraper):
         Returns:
             URL slug or None if not found
         """
-        # If it's already a slug (alphabetic), return as-is
-        if re.match(r"^[a-z-]+$", sku):
-            return sku
-
-        # Parse SKU components
-        components = vibia_price_list.parse_sku_components(sku)
-        if components and "model" in components:
-            model = components["model"]
-            product = vibia_price_list.get_product_by_model(model)
-            if product:
-                return product["url_slug"]
-
-        # Try extracting first 4 digits as model number
-        model_match = re.match(r"^(\d{4})", sku)
-        if model_match:
-            model = model_match.group(1)
-            product = vibia_price_list.get_product_by_model(model)
-            if product:
-                return product["url_slug"]
-
-        return None
+        return _resolve_sku(sku)[1]
 
     def _ensure_browser(self) -> None:
         """Ensure browser is initialized and ready for use."""
@@ -181,33 +391,42 @@ class VibiaScraper(BaseScraper):
         Raises:
             Exception: If scraping fails
         """
-        self._ensure_browser()
-        assert self._page is not None
-
         logger.info(f"Scraping Vibia product: {sku}")
 
+        # Background fetches left over from the previous product are stale
+        self._pending_json.clear()
+
         # Try each language in priority order
-        for language in self.config.language_priority or ["de"]:
+        languages = self.config.language_priority or ["de"]
+        for index, language in enumerate(languages):
             try:
                 url = self.build_product_url(sku, language)
                 logger.debug(f"Attempting URL: {url}")
 
-                self._page.goto(
-                    url,
-                    wait_until="domcontentloaded",
-                    timeout=self.config.timeout * 1000,
-                )
-                self._page.wait_for_load_state("networkidle", timeout=10000)
+                # Fast path: read server-rendered __NEXT_DATA__ without a browser
+                prefetched = self._prefetched_json.get(url)
+                if prefetched is None and url in self._pending_json:
+                    prefetched = self._pending_json.pop(url).result()
+                status, json_data = prefetched or self._fetch_json_via_http(url)
+                if status in (404, 410):
+                    logger.warning(f"{url} not found, trying next language")
+                    continue
 
-                # Extract JSON data from Next.js page
-                json_data = self._extract_json_data(self._page)
+                if json_data is not None:
+                    feature_props = self._get_feature_props(json_data)
+                else:
+                    # Blocked, client-rendered or auth-gated: render in the browser,
+                    # fetching the next language over HTTP in the meantime
+                    if index + 1 < len(languages):
+                        self._fetch_json_in_background(sku, languages[index + 1])
+                    feature_props = self._fetch_json_via_browser(url)
 
-                if not json_data:
+                if feature_props is None:
                     logger.warning(f"No JSON data found at {url}, trying next language")
                     continue
 
                 # Parse product data from JSON
-                products = self._parse_product_data(json_data, sku, language)
+                products = self._parse_product_data(feature_props, sku, language)
 
                 if products:
                     logger.success(
@@ -216,19 +435,15 @@ class VibiaScraper(BaseScraper):
 
                     # Download product files if credentials are available
                     try:
-                        feature_props = (
-                            json_data.get("props", {})
-                            .get("pageProps", {})
-                            .get("featureProps", {})
-                        )
-
                         if feature_props:
                             # Use parent SKU as output directory name
                             base_sku = products[0].sku if products else sku
                             output_dir = Path(output_base) / str(base_sku)
 
                             # Download files (manual and specSheet)
-                            self.download_product_files(output_dir=output_dir)
+                            self.download_product_files(
+                                output_dir=output_dir, product_url=url
+                            )
                     except Exception as e:
                         logger.warning(f"File download failed: {e}")
                         # Continue anyway - downloads are optional
@@ -244,33 +459,147 @@ class VibiaScraper(BaseScraper):
 
         raise Exception(f"Failed to scrape product {sku} in all languages")
 
-    def _extract_json_data(self, page: Page) -> dict[str, Any] | None:
-        """Extract JSON-LD or Next.js data from page.
+    def _fetch_json_in_background(self, sku: SKU, language: str) -> None:
+        """Start an HTTP fetch of a product page for scrape_product to pick up.
 
         Args:
-            page: Playwright Page instance
+            sku: Product identifier
+            language: Language of the page to fetch
+        """
+        try:
+            url = self.build_product_url(sku, language)
+        except ValueError:
+            return
+        if url in self._pending_json or url in self._prefetched_json:
+            return
+
+        if self._fallback_executor is None:
+            self._fallback_executor = ThreadPoolExecutor(max_workers=1)
+        # Create the client up front so the worker does not race to build it
+        self.get_http_client()
+        self._pending_json[url] = self._fallback_executor.submit(
+            self._fetch_json_via_http, url
+        )
+
+    def _fetch_json_via_http(self, url: str) -> tuple[int | None, dict[str, Any] | None]:
+        """Fetch a product page over HTTP and read its inlined __NEXT_DATA__.
+
+        Args:
+            url: Product page URL
 
         Returns:
-            JSON data dictionary or None if not found
+            Tuple of (HTTP status or None on network error, parsed JSON or None
+            if the page has no usable __NEXT_DATA__)
         """
         try:
-            # Try extracting __NEXT_DATA__ from Next.js
-            json_data = page.evaluate("() => window.__NEXT_DATA__")
-            if json_data:
-                logger.debug("Extracted __NEXT_DATA__ from page")
-                return json_data
-        except Exception as e:
-            logger.debug(f"Could not extract __NEXT_DATA__: {e}")
+            response = self.get_http_client().get(url)
+        except httpx.HTTPError as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None, None
+
+        if response.status_code >= 400:
+            logger.debug(f"HTTP {response.status_code} for {url}")
+            return response.status_code, None
+
+        match = _NEXT_DATA_RE.search(response.content)
+        if not match:
+            logger.debug(f"No __NEXT_DATA__ in HTML of {url}")
+            return response.status_code, None
+
+        try:
+            json_data = orjson.loads(match.group(1))
+        except orjson.JSONDecodeError as e:
+            logger.debug(f"Invalid __NEXT_DATA__ JSON at {url}: {e}")
+            return response.status_code, None
+
+        logger.debug(f"Extracted __NEXT_DATA__ over HTTP from {url}")
+        return response.status_code, json_data
+
+    @staticmethod
+    def _get_feature_props(json_data: dict[str, Any]) -> dict[str, Any]:
+        """Return the props.pageProps.featureProps subtree of __NEXT_DATA__.
+
+        Args:
+            json_data: Full __NEXT_DATA__ object
+
+        Returns:
+            featureProps dictionary, empty if the page has none
+        """
+        return _dig(json_data, _FEATURE_PROPS, {})
+
+    def _fetch_json_via_browser(self, url: str) -> dict[str, Any] | None:
+        """Render a product page in the browser and extract its featureProps.
+
+        Args:
+            url: Product page URL
+
+        Returns:
+            featureProps dictionary or None if the page has no product data
+        """
+        self._ensure_browser()
+        assert self._page is not None
+
+        self._goto_with_retry(url)
+        # __NEXT_DATA__ is inlined server-side; its script tag is the
+        # readiness signal (networkidle waits on trackers)
+        try:
+            self._page.wait_for_selector(
+                "script#__NEXT_DATA__",
+                state="attached",
+                timeout=NEXT_DATA_TIMEOUT,
+            )
+        except PlaywrightTimeout:
+            logger.debug(f"No __NEXT_DATA__ script at {url}, trying JSON-LD")
+
+        return self._extract_json_data(self._page)
+
+    def _goto_with_retry(self, url: str) -> None:
+        """Navigate to URL, retrying transient timeouts with backoff.
+
+        Args:
+            url: URL to navigate to
+
+        Raises:
+            PlaywrightTimeout: If every attempt times out
+        """
+        retry_with_backoff(
+            lambda: self._page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=self.config.timeout * 1000,
+            ),
+            max_retries=GOTO_RETRIES,
+            base_delay=GOTO_RETRY_DELAY,
+            retry_on=(PlaywrightTimeout,),
+        )
+
+    def _extract_json_data(self, page: Page) -> dict[str, Any] | None:
+        """Extract Next.js featureProps from page, or detect JSON-LD.
+
+        Only the featureProps subtree crosses the Playwright boundary; the
+        rest of __NEXT_DATA__ is never serialized.
+
+        Args:
+            page: Playwright Page instance
 
+        Returns:
+            featureProps dictionary (empty when the page only has JSON-LD or
+            __NEXT_DATA__ without featureProps) or None if neither is found
+        """
         try:
-            # Try extracting from script tags with type="application/ld+json"
-            json_ld = page.evaluate(
+            # One round trip: featureProps from __NEXT_DATA__, else {} when the
+            # page has valid JSON-LD (which carries no featureProps; the price
+            # list fills in the product), else null
+            feature_props = page.evaluate(
                 """
                 () => {
+                    if (window.__NEXT_DATA__) {
+                        return window.__NEXT_DATA__.props?.pageProps?.featureProps ?? {};
+                    }
                     const scripts = document.querySelectorAll('script[type="application/ld+json"]');
                     for (const script of scripts) {
                         try {
-                            return JSON.parse(script.textContent);
+                            if (JSON.parse(script.textContent)) return {};
                         } catch (e) {
                             continue;
                         }
@@ -279,21 +608,21 @@ class VibiaScraper(BaseScraper):
                 }
                 """
             )
-            if json_ld:
-                logger.debug("Extracted JSON-LD data from page")
-                return json_ld
         except Exception as e:
-            logger.debug(f"Could not extract JSON-LD: {e}")
+            logger.debug(f"Could not extract page data: {e}")
+            return None
 
-        return None
+        if feature_props is not None:
+            logger.debug("Found __NEXT_DATA__ or JSON-LD data on page")
+        return feature_props
 
     def _parse_product_data(
-        self, json_data: dict[str, Any], sku: SKU, language: str
+        self, feature_props: dict[str, Any], sku: SKU, language: str
     ) -> list[ProductData]:
-        """Parse product data from JSON structure.
+        """Parse product data from the Next.js featureProps structure.
 
         Args:
-            json_data: JSON data extracted from page
+            feature_props: props.pageProps.featureProps from __NEXT_DATA__
             sku: Original SKU requested
             language: Language code used
 
@@ -301,12 +630,6 @@ class VibiaScraper(BaseScraper):
             List of ProductData objects
         """
         try:
-            # Extract product info from Next.js data structure
-            # Vibia uses: props.pageProps.featureProps.data
-            props = json_data.get("props", {})
-            page_props = props.get("pageProps", {})
-            feature_props = page_props.get("featureProps", {})
-
             # Get the main product data
             product_data = feature_props.get("data", {})
 
@@ -355,7 +678,7 @@ class VibiaScraper(BaseScraper):
         name = (
             json_data.get("name")
             or json_data.get("title")
-            or json_data.get("data", {}).get("name")
+            or _dig(json_data, _DATA_NAME)
         )
 
         if name:
@@ -370,19 +693,16 @@ class VibiaScraper(BaseScraper):
     def _extract_description(self, json_data: dict[str, Any]) -> str:
         """Extract product description from JSON data."""
         # Vibia stores description in technicalInfo.description as array of paragraph objects
-        tech_info = json_data.get("technicalInfo", {})
-        description_list = tech_info.get("description", [])
+        description_list = _dig(json_data, _TECH_DESCRIPTION)
 
         if isinstance(description_list, list):
             # Extract paragraph text from each object
-            paragraphs = []
-            for item in description_list:
-                if isinstance(item, dict):
-                    para = item.get("paragraph", "")
-                    if para:
-                        paragraphs.append(str(para))
-                elif isinstance(item, str):
-                    paragraphs.append(item)
+            paragraphs = [
+                str(item["paragraph"]) if isinstance(item, dict) else item
+                for item in description_list
+                if (isinstance(item, dict) and item.get("paragraph"))
+                or isinstance(item, str)
+            ]
             return "\n\n".join(paragraphs)
         elif isinstance(description_list, str):
             return description_list
@@ -394,19 +714,12 @@ class VibiaScraper(BaseScraper):
         images: list[ImageUrl] = []
 
         # Extract from hero.media (desktop, tablet, mobile)
-        hero = json_data.get("hero", {})
-        media = hero.get("media", {})
+        media = _dig(json_data, _HERO_MEDIA, {})
 
         for variant in ["desktop", "tablet", "mobile"]:
-            variant_data = media.get(variant, {})
-            url = variant_data.get("url")
+            url = _dig(media, (variant, "url"))
             if url:
-                # Ensure full URL
-                if url.startswith("//"):
-                    url = f"https:{url}"
-                elif url.startswith("/"):
-                    url = f"{self.config.base_url}{url}"
-                images.append(ImageUrl(url))
+                images.append(ImageUrl(self._absolute_url(url)))
                 break  # Only take the first available image
 
         # Fallback: try strapiMedia if no hero images found
@@ -417,17 +730,30 @@ class VibiaScraper(BaseScraper):
                     if isinstance(img, dict):
                         url = (
                             img.get("url")
-                            or img.get("large", {}).get("url")
-                            or img.get("medium", {}).get("url")
+                            or _dig(img, _LARGE_URL)
+                            or _dig(img, _MEDIUM_URL)
                         )
                         if url:
-                            if url.startswith("//"):
-                                url = f"https:{url}"
-                            elif url.startswith("/"):
-                                url = f"{self.config.base_url}{url}"
-                            images.append(ImageUrl(url))
+                            images.append(ImageUrl(self._absolute_url(url)))
+                            if len(images) >= self.MAX_IMAGES:
+                                break
 
-        return images[:10]  # Limit to 10 images
+        return images
+
+    def _absolute_url(self, url: str) -> str:
+        """Complete a protocol-relative or site-relative media URL.
+
+        Args:
+            url: URL as found in the page data
+
+        Returns:
+            Absolute URL
+        """
+        if url.startswith("//"):
+            return f"https:{url}"
+        if url.startswith("/"):
+            return f"{self.config.base_url}{url}"
+        return url
 
     def _extract_attributes(
         self, json_data: dict[str, Any], price_list_products: list[Any]
@@ -469,18 +795,15 @@ class VibiaScraper(BaseScraper):
         categories: list[str] = []
 
         # Extract from data.hero.applicationBreadcrumb
-        product_data = feature_props.get("data", {})
-        hero = product_data.get("hero", {})
-        breadcrumb = hero.get("applicationBreadcrumb", [])
+        breadcrumb = _dig(feature_props, _HERO_BREADCRUMB)
 
         if isinstance(breadcrumb, list):
-            for item in breadcrumb:
-                if isinstance(item, dict):
-                    text = item.get("text")
-                    if text:
-                        categories.append(str(text))
-                elif isinstance(item, str):
-                    categories.append(item)
+            categories = [
+                str(item["text"]) if isinstance(item, dict) else item
+                for item in breadcrumb
+                if (isinstance(item, dict) and item.get("text"))
+                or isinstance(item, str)
+            ]
 
         # Also add collection family from featureProps.collection
         collection = feature_props.get("collection", {})
@@ -532,16 +855,14 @@ class VibiaScraper(BaseScraper):
 
         # Filter variants if specific one was requested
         if requested_control_code:
+            control_code = requested_control_code.upper()
+            control_suffix = f"/{control_code}"
             filtered_variants = []
             for v in all_variants:
                 # Match control code (e.g., "9Z") - case-insensitive
-                control_match = v[
-                    "control_code"
-                ].upper() == requested_control_code.upper() or v[
+                control_match = v["control_code"].upper() == control_code or v[
                     "sku"
-                ].upper().endswith(
-                    f"/{requested_control_code.upper()}"
-                )
+                ].upper().endswith(control_suffix)
 
                 # Match surface code if specified (e.g., "24")
                 surface_match = True
@@ -659,11 +980,22 @@ class VibiaScraper(BaseScraper):
             )
         )
 
+        # Fields shared by every variation, built once for the whole loop
+        variation_kwargs = {
+            "description": description,
+            "manufacturer": self.config.manufacturer,
+            "categories": categories,
+            "attributes": attributes,
+            "images": images,
+            "product_type": "variation",
+            "parent_sku": SKU(parent_sku),
+            "dimensions": dimensions,
+            "cable_length": cable_length,
+            "ip_rating": ip_rating,
+        }
+
         # Create variant products (children)
         for variant in all_variants:
-            variant_sku = SKU(variant["sku"])
-            variant_name = f"{name} - {variant['led_name_en']}"
-
             # Map variation attributes to keys that CSV exporter recognizes
             variation_attrs = {
                 "Color": variant["surface_name_en"],  # Maps to "Farbe"
@@ -673,20 +1005,11 @@ class VibiaScraper(BaseScraper):
 
             products.append(
                 ProductData(
-                    sku=variant_sku,
-                    name=variant_name,
-                    description=description,
-                    manufacturer=self.config.manufacturer,
-                    categories=categories,
-                    attributes=attributes,
-                    images=images,
-                    product_type="variation",
-                    parent_sku=SKU(parent_sku),
+                    sku=SKU(variant["sku"]),
+                    name=f"{name} - {variant['led_name_en']}",
                     variation_attributes=variation_attrs,
                     regular_price=variant["price_eur"],
-                    dimensions=dimensions,
-                    cable_length=cable_length,
-                    ip_rating=ip_rating,
+                    **variation_kwargs,
                 )
             )
 
@@ -694,17 +1017,11 @@ class VibiaScraper(BaseScraper):
 
     def _get_base_sku(self, sku: SKU) -> str:
         """Extract base SKU (model number) from any SKU format."""
-        components = vibia_price_list.parse_sku_components(sku)
-        if components and "model" in components:
-            return components["model"]
-
-        # Try extracting first 4 digits
-        model_match = re.match(r"^(\d{4})", sku)
-        if model_match:
-            return model_match.group(1)
+        model, slug = _resolve_sku(sku)
+        if model:
+            return model
 
         # Try getting from slug
-        slug = self._extract_slug_from_sku(sku)
         if slug:
             products = vibia_price_list.get_product_by_slug(slug)
             if products:
@@ -752,48 +1069,43 @@ class VibiaScraper(BaseScraper):
             Dictionary with catalogId, familyId, subFamilyId, applicationLocationId
             or None if required fields are missing
         """
+        # Direct subscripting on the fixed path; any missing level lands in except
         try:
-            data = feature_props.get("data", {})
-            collection = feature_props.get("collection", {})
-
-            catalog_id = data.get("id")
-            if not catalog_id:
-                logger.warning("No catalog ID found in product data")
-                return None
-
-            # Extract IDs from collection data
-            family = collection.get("family", {})
-            sub_family = collection.get("subFamily", {})
-            applications_locations = collection.get("applicationsLocations", [])
-
-            family_id = family.get("id")
-            sub_family_id = sub_family.get("id")
-
-            # Use first application location if available
-            application_location_id = None
-            if applications_locations and len(applications_locations) > 0:
-                application_location_id = applications_locations[0].get("id")
+            catalog_id = feature_props["data"]["id"]
+            collection = feature_props["collection"]
+            family_id = collection["family"]["id"]
+            sub_family_id = collection["subFamily"]["id"]
+            # Use first application location
+            application_location_id = collection["applicationsLocations"][0]["id"]
+        except (KeyError, IndexError, TypeError) as e:
+            logger.warning(f"Missing download ID field in product data: {e!r}")
+            return None
 
-            if not all([family_id, sub_family_id, application_location_id]):
-                logger.warning(
-                    f"Missing required IDs: family={family_id}, "
-                    f"subFamily={sub_family_id}, appLocation={application_location_id}"
-                )
-                return None
-
-            return {
-                "catalog_id": str(catalog_id),
-                "model_id": str(catalog_id),
-                "family_id": family_id,
-                "sub_family_id": sub_family_id,
-                "application_location_id": application_location_id,
-            }
+        if not catalog_id:
+            logger.warning("No catalog ID found in product data")
+            return None
 
-        except Exception as e:
-            logger.error(f"Error extracting download IDs: {e}")
+        if not all([family_id, sub_family_id, application_location_id]):
+            logger.warning(
+                f"Missing required IDs: family={family_id}, "
+                f"subFamily={sub_family_id}, appLocation={application_location_id}"
+            )
             return None
 
-    def _extract_zip_safely(self, zip_ref: zipfile.ZipFile, output_dir: Path) -> None:
+        return {
+            "catalog_id": str(catalog_id),
+            "model_id": str(catalog_id),
+            "family_id": family_id,
+            "sub_family_id": sub_family_id,
+            "application_location_id": application_location_id,
+        }
+
+    def _extract_zip_safely(
+        self,
+        zip_ref: zipfile.ZipFile,
+        output_dir: Path,
+        members: list[zipfile.ZipInfo] | None = None,
+    ) -> int:
         """Safely extract ZIP file with security validation.
 
         Protects against:
@@ -803,18 +1115,23 @@ class VibiaScraper(BaseScraper):
         Args:
             zip_ref: Open ZipFile object
             output_dir: Target extraction directory
+            members: Members to extract (default: all). The whole archive is
+                validated either way.
+
+        Returns:
+            Number of members extracted
 
         Raises:
             ValueError: If ZIP contains malicious content
         """
-        output_dir_resolved = output_dir.resolve()
         max_size = 500 * 1024 * 1024  # 500 MB max total size
 
+        # Validate every member before writing anything, so a bad entry late
+        # in the archive cannot leave a partial extraction behind
         total_size = 0
         for file_info in zip_ref.filelist:
-            # Check for path traversal
-            member_path = (output_dir / file_info.filename).resolve()
-            if not str(member_path).startswith(str(output_dir_resolved)):
+            # Check for path traversal (textual, no filesystem resolve needed)
+            if _is_unsafe_zip_member(file_info.filename):
                 raise ValueError(f"ZIP contains unsafe path: {file_info.filename}")
 
             # Check for zip bomb
@@ -825,7 +1142,8 @@ class VibiaScraper(BaseScraper):
                 )
 
         # Extract all files (validated as safe)
-        zip_ref.extractall(output_dir)
+        zip_ref.extractall(output_dir, members)
+        return len(zip_ref.filelist if members is None else members)
 
     def _extract_and_process_zip(self, zip_path: Path, output_dir: Path) -> int:
         """Extract ZIP file and handle nested ZIPs.
@@ -837,71 +1155,47 @@ class VibiaScraper(BaseScraper):
         Returns:
             Total number of files extracted (including from nested ZIPs)
         """
-        total_files = 0
-
-        # Extract main ZIP
         with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            filenames = zip_ref.namelist()
-            self._extract_zip_safely(zip_ref, output_dir)
-            total_files += len(filenames)
+            members = zip_ref.infolist()
+            nested_zips = [
+                member
+                for member in members
+                if "/" not in member.filename and member.filename.lower().endswith(".zip")
+            ]
+            # Nested ZIPs are unpacked straight from the outer archive instead
+            # of being written out, re-read and deleted
+            total_files = self._extract_zip_safely(
+                zip_ref, output_dir, [m for m in members if m not in nested_zips]
+            )
 
-        # Delete the main ZIP file to avoid finding it when searching for nested ZIPs
-        zip_path.unlink()
+            for nested_zip in nested_zips:
+                logger.debug(f"Found nested ZIP: {nested_zip.filename}")
+                total_files += 1
+                try:
+                    # Its size was checked with the outer archive, so it is
+                    # bounded by the same zip bomb limit
+                    with zipfile.ZipFile(io.BytesIO(zip_ref.read(nested_zip))) as nested_ref:
+                        nested_count = self._extract_zip_safely(nested_ref, output_dir)
+                        total_files += nested_count
+                        logger.debug(f"Extracted {nested_count} files from nested ZIP")
+                except zipfile.BadZipFile:
+                    logger.warning(
+                        f"Nested file {nested_zip.filename} is not a valid ZIP, keeping as-is"
+                    )
+                    zip_ref.extract(nested_zip, output_dir)
+                except Exception as e:
+                    # Keep the archive for manual handling, as it would have
+                    # been had it been extracted to disk first
+                    logger.warning(
+                        f"Failed to extract nested ZIP {nested_zip.filename}, "
+                        f"keeping as-is: {e}"
+                    )
+                    zip_ref.extract(nested_zip, output_dir)
 
-        # Check for nested ZIPs and extract them
-        nested_zips = list(output_dir.glob("*.zip"))
-        for nested_zip in nested_zips:
-            logger.debug(f"Found nested ZIP: {nested_zip.name}")
-            try:
-                with zipfile.ZipFile(nested_zip, "r") as nested_ref:
-                    self._extract_zip_safely(nested_ref, output_dir)
-                    nested_count = len(nested_ref.namelist())
-                    total_files += nested_count
-                    logger.debug(f"Extracted {nested_count} files from nested ZIP")
-                # Remove nested ZIP after extraction
-                nested_zip.unlink()
-            except zipfile.BadZipFile:
-                logger.warning(
-                    f"Nested file {nested_zip.name} is not a valid ZIP, keeping as-is"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to extract nested ZIP {nested_zip.name}: {e}")
+        zip_path.unlink()
 
         return total_files
 
-    def _rename_extracted_documents(self, output_dir: Path) -> None:
-        """Rename extracted documents based on their type.
-
-        Renames files to standardized names:
-        - Spec sheets → spec_sheet.pdf
-        - Manuals → instruction_manual.pdf
-
-        Args:
-            output_dir: Directory containing extracted files
-        """
-        for file_path in output_dir.glob("*.pdf"):
-            filename_lower = file_path.name.lower()
-
-            # Determine new name based on file content indicators
-            new_name = None
-            if "spec" in filename_lower or "technical" in filename_lower:
-                new_name = "spec_sheet.pdf"
-            elif (
-                "man" in filename_lower
-                or "manual" in filename_lower
-                or "instruction" in filename_lower
-            ):
-                new_name = "instruction_manual.pdf"
-
-            # Rename if we identified the document type
-            if new_name:
-                new_path = output_dir / new_name
-                # If target already exists, remove it first
-                if new_path.exists():
-                    new_path.unlink()
-                file_path.rename(new_path)
-                logger.debug(f"Renamed {file_path.name} → {new_name}")
-
     def _find_image_files(self, directory: Path) -> list[Path]:
         """Find all image files recursively in a directory (case-insensitive).
 
@@ -911,133 +1205,47 @@ class VibiaScraper(BaseScraper):
         Returns:
             List of unique image file paths (deduplicated)
         """
-        # Use both lowercase and uppercase patterns for case-insensitive matching
-        image_extensions = [
-            "*.jpg", "*.JPG",
-            "*.jpeg", "*.JPEG",
-            "*.png", "*.PNG",
-            "*.webp", "*.WEBP"
-        ]
+        # One scandir-based walk; each file is seen once, so no dedup is needed
+        # (unlike per-pattern rglob, where *.jpg and *.JPG overlap on Windows)
         image_files = []
-        for ext in image_extensions:
-            image_files.extend(directory.rglob(ext))
-
-        # Deduplicate using resolved paths (Windows filesystem is case-insensitive)
-        # This prevents the same file from being found by both *.jpg and *.JPG patterns
-        seen_paths = set()
-        unique_files = []
-        for img in image_files:
-            resolved = img.resolve()
-            if resolved not in seen_paths:
-                seen_paths.add(resolved)
-                unique_files.append(img)
-
-        return unique_files
-
-    def _filter_unclassified_images(
-        self, image_files: list[Path], product_dir: Path, project_dir: Path
-    ) -> list[Path]:
-        """Filter out images that are already in classified directories.
+        for root, _dirs, files in os.walk(directory):
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() in IMAGE_FILE_SUFFIXES:
+                    image_files.append(Path(root) / name)
 
-        Args:
-            image_files: List of all image files
-            product_dir: Product images directory
-            project_dir: Project images directory
+        return image_files
 
-        Returns:
-            List of images that need classification
-        """
-        return [
-            img
-            for img in image_files
-            if not (img.parent == product_dir or img.parent == project_dir)
-        ]
+    def _remove_duplicate_images(
+        self, image_files: list[Path], candidates: list[Path]
+    ) -> list[Path]:
+        """Delete candidate images whose bytes match an earlier image.
 
-    def _is_duplicate_image(
-        self, image_path: Path, product_dir: Path, project_dir: Path
-    ) -> bool:
-        """Check if an image file already exists in destination directories.
+        Already-classified images count as seen first, so a re-downloaded copy
+        of one is removed too.
 
         Args:
-            image_path: Path to image file
-            product_dir: Product images directory
-            project_dir: Project images directory
+            image_files: All image files found, classified ones included
+            candidates: Images still to classify, in discovery order
 
         Returns:
-            True if image with same name exists in either directory
-        """
-        return (product_dir / image_path.name).exists() or (
-            project_dir / image_path.name
-        ).exists()
-
-    def _move_classified_image(
-        self,
-        image_file: Path,
-        classification: str,
-        product_dir: Path,
-        project_dir: Path,
-    ) -> None:
-        """Move image to appropriate directory based on classification.
-
-        Args:
-            image_file: Path to image file
-            classification: Classification result ("product" or "project")
-            product_dir: Product images directory
-            project_dir: Project images directory
-
-        Raises:
-            FileNotFoundError: If image file doesn't exist
-            OSError: If move operation fails
+            Candidates that are not duplicates, order preserved
         """
-        if classification == "product":
-            dest = product_dir / image_file.name
-            image_file.rename(dest)
-            logger.info(f"✓ Product image: {image_file.name}")
-        elif classification == "project":
-            dest = project_dir / image_file.name
-            image_file.rename(dest)
-            logger.info(f"✓ Project image: {image_file.name}")
-        else:
-            # Fallback to product for unknown classifications
-            dest = product_dir / image_file.name
-            image_file.rename(dest)
-            logger.warning(
-                f"Unknown classification '{classification}', "
-                f"defaulting to product: {image_file.name}"
-            )
-
-    def _cleanup_leftover_files(
-        self, output_dir: Path, product_dir: Path, project_dir: Path
-    ) -> None:
-        """Clean up leftover ZIP files and empty directories.
-
-        Args:
-            output_dir: Root output directory
-            product_dir: Product images directory (preserved)
-            project_dir: Project images directory (preserved)
-        """
-        # Remove leftover ZIP files
-        for zip_file in output_dir.rglob("*.zip"):
-            try:
-                zip_file.unlink()
-                logger.debug(f"Removed leftover ZIP: {zip_file.name}")
-            except (OSError, PermissionError) as e:
-                logger.debug(f"Could not remove ZIP {zip_file.name}: {e}")
-
-        # Remove empty directories (preserve images/ subdirs)
-        images_dir = output_dir / "images"
-        preserved_dirs = {product_dir, project_dir, images_dir}
-
-        for subdir in sorted(output_dir.rglob("*"), reverse=True):
-            if not subdir.is_dir() or subdir in preserved_dirs:
+        candidate_set = set(candidates)
+        ordered = [img for img in image_files if img not in candidate_set] + candidates
+        with ThreadPoolExecutor(max_workers=CLASSIFY_WORKERS) as executor:
+            digests = list(executor.map(_file_digest, ordered))
+
+        seen: set[bytes] = set()
+        unique = []
+        for image_file, digest in zip(ordered, digests):
+            if digest in seen and image_file in candidate_set:
+                image_file.unlink()
+                logger.debug(f"Removed duplicate image: {image_file.name}")
                 continue
-
-            try:
-                if not any(subdir.iterdir()):  # Directory is empty
-                    subdir.rmdir()
-                    logger.debug(f"Removed empty directory: {subdir.name}")
-            except (OSError, PermissionError) as e:
-                logger.debug(f"Could not remove directory {subdir.name}: {e}")
+            seen.add(digest)
+            if image_file in candidate_set:
+                unique.append(image_file)
+        return unique
 
     def _classify_and_organize_images(self, images_dir: Path) -> None:
         """Classify downloaded images as product or project using AI.
@@ -1049,11 +1257,6 @@ class VibiaScraper(BaseScraper):
         Args:
             images_dir: Directory containing extracted image files
         """
-        import time
-
-        # Import here to avoid circular dependency
-        from src.ai.image_classifier import classify_image_file
-
         # Find all image files in images_dir and subdirectories
         image_files = self._find_image_files(images_dir)
         if not image_files:
@@ -1062,14 +1265,20 @@ class VibiaScraper(BaseScraper):
 
         # Filter out already-classified images (product_XX or project_XX)
         images_to_classify = [
-            img for img in image_files
-            if not (img.name.startswith("product_") or img.name.startswith("project_"))
+            img for img in image_files if not img.name.startswith(("product_", "project_"))
         ]
 
         if not images_to_classify:
             logger.debug("All images already classified")
             return
 
+        # Product and ambient archives often ship byte-identical copies; drop
+        # them before they cost a classifier call
+        images_to_classify = self._remove_duplicate_images(image_files, images_to_classify)
+        if not images_to_classify:
+            logger.debug("All new images were duplicates")
+            return
+
         logger.info(f"Classifying {len(images_to_classify)} images using AI...")
 
         # Count existing classified images to continue numbering
@@ -1078,12 +1287,42 @@ class VibiaScraper(BaseScraper):
         product_counter = existing_product
         project_counter = existing_project
 
-        # Classify and rename each image
-        for image_file in images_to_classify:
+        # Folder names inside the archives often say what the images are;
+        # only images without such a hint go to the AI classifier
+        hints = [_image_type_hint(img, images_dir) for img in images_to_classify]
+        logger.debug(
+            f"{sum(1 for hint in hints if hint)} image(s) classified by folder name"
+        )
+
+        # Classify concurrently; requests start at most every
+        # CLASSIFY_REQUEST_INTERVAL seconds across all workers
+        futures = {}
+        classify_image_file = _load_image_classifier()
+        if classify_image_file is None:
+            if not all(hints):
+                logger.warning(
+                    "AI image classifier not installed; "
+                    "unhinted images are treated as project images"
+                )
+        else:
+            # Without an API key only cached classifications come back, so
+            # there are no API requests to space out
+            request_interval = CLASSIFY_REQUEST_INTERVAL if os.getenv("OPENAI_API_KEY") else 0
+            with ThreadPoolExecutor(max_workers=CLASSIFY_WORKERS) as executor:
+                for image_file, hint in zip(images_to_classify, hints):
+                    if hint:
+                        continue
+                    if futures and request_interval:
+                        time.sleep(request_interval)  # Rate limiting prevention
+                    futures[image_file] = executor.submit(
+                        classify_image_file, str(image_file)
+                    )
+
+        # Rename serially, in the original order, so numbering stays stable
+        for image_file, hint in zip(images_to_classify, hints):
             try:
-                # Classify image
-                classification = classify_image_file(str(image_file))
-                time.sleep(0.5)  # Rate limiting prevention
+                future = futures.get(image_file)
+                classification = hint or (future.result() if future else "project")
 
                 # Determine new filename based on classification
                 ext = image_file.suffix.lower() or ".jpg"
@@ -1095,15 +1334,10 @@ class VibiaScraper(BaseScraper):
                     new_name = f"project_{project_counter:02d}{ext}"
                     project_counter += 1
 
-                # Move/rename to images_dir with new name
+                # Move/rename to images_dir with new name; subdirectories sit on
+                # the same filesystem, so one atomic replace covers both cases
                 dest = images_dir / new_name
-                if image_file.parent != images_dir:
-                    # File is in a subdirectory, move it
-                    import shutil
-                    shutil.move(str(image_file), str(dest))
-                else:
-                    # File is already in images_dir, just rename
-                    image_file.rename(dest)
+                os.replace(image_file, dest)
 
                 logger.info(f"✓ {classification.capitalize()} image: {new_name}")
 
@@ -1140,39 +1374,42 @@ class VibiaScraper(BaseScraper):
             return False
 
         try:
-            logger.info(f"Logging in to Vibia as {email} via API...")
-
-            # Login via API to get cookies
-            vibia_auth = VibiaAuth(email=email, password=password)
-            if not vibia_auth.login():
-                logger.error("Failed to authenticate with Vibia API")
-                return False
+            # Login via API once per LOGIN_SESSION_TTL; later products reuse the session
+            vibia_auth = self._vibia_auth
+            if (
+                vibia_auth is None
+                or not vibia_auth.auth_token
+                or time.monotonic() - self._login_time > LOGIN_SESSION_TTL
+            ):
+                logger.info(f"Logging in to Vibia as {email} via API...")
+                vibia_auth = self._vibia_auth or VibiaAuth(email=email, password=password)
+                self._vibia_auth = vibia_auth
+                if not vibia_auth.login():
+                    logger.error("Failed to authenticate with Vibia API")
+                    return False
+                self._login_time = time.monotonic()
 
             # Extract cookies from httpx client and prepare for Playwright
             if not vibia_auth.client:
                 logger.error("VibiaAuth client not initialized after login")
                 return False
 
-            cookies = []
-            for cookie in vibia_auth.client.cookies.jar:
-                # Skip cookies without name or value
-                if not cookie.name or not cookie.value:
-                    continue
-
-                # Set domain to work across Vibia subdomains (www, app, api)
-                # Default to .vibia.com if domain is None or doesn't contain vibia.com
-                domain = cookie.domain or ""
-                if not domain or "vibia.com" in domain:
-                    domain = ".vibia.com"
-
-                cookies.append(
-                    {
-                        "name": cookie.name,
-                        "value": cookie.value,
-                        "domain": domain,
-                        "path": cookie.path or "/",
-                    }
-                )
+            # Skip cookies without name or value. Unset and vibia.com domains are
+            # widened to .vibia.com so they apply across subdomains (www, app, api)
+            cookies = [
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": (
+                        VIBIA_COOKIE_DOMAIN
+                        if not cookie.domain or "vibia.com" in cookie.domain
+                        else cookie.domain
+                    ),
+                    "path": cookie.path or "/",
+                }
+                for cookie in vibia_auth.client.cookies.jar
+                if cookie.name and cookie.value
+            ]
 
             if not cookies:
                 logger.warning("No cookies obtained from API login")
@@ -1212,8 +1449,8 @@ class VibiaScraper(BaseScraper):
                 close_btn = self._page.locator(selector).first
                 if close_btn.is_visible(timeout=1000):
                     close_btn.click()
+                    close_btn.wait_for(state="hidden", timeout=MODAL_DISMISS_TIMEOUT)
                     logger.debug("Dismissed region selection modal")
-                    self._page.wait_for_timeout(500)
                     return
             except Exception:
                 continue
@@ -1223,8 +1460,8 @@ class VibiaScraper(BaseScraper):
             enter_btn = self._page.locator('button:has-text("Website betreten")').first
             if enter_btn.is_visible(timeout=1000):
                 enter_btn.click()
+                enter_btn.wait_for(state="hidden", timeout=MODAL_DISMISS_TIMEOUT)
                 logger.debug("Dismissed region modal via 'Website betreten' button")
-                self._page.wait_for_timeout(500)
         except Exception:
             pass
 
@@ -1232,26 +1469,38 @@ class VibiaScraper(BaseScraper):
         """Dismiss cookie consent banner if present."""
         assert self._page is not None
 
-        cookie_selectors = [
-            "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
-            "#CybotCookiebotDialogBodyButtonAccept",
-            'button:has-text("Accept all")',
-            'button:has-text("Allow all")',
-            'button:has-text("Alle akzeptieren")',
-        ]
-        for selector in cookie_selectors:
-            try:
-                btn = self._page.locator(selector).first
-                if btn.is_visible(timeout=1000):
-                    btn.click()
-                    logger.debug("Dismissed cookie banner")
-                    self._page.wait_for_timeout(500)
-                    return
-            except Exception:
-                continue
+        # One compound locator: a single round trip finds whichever accept
+        # button is visible instead of probing each selector in turn
+        btn = self._page.locator(COOKIE_ACCEPT_SELECTOR).first
+        try:
+            if btn.is_visible():
+                btn.click()
+                btn.wait_for(state="hidden", timeout=MODAL_DISMISS_TIMEOUT)
+                logger.debug("Dismissed cookie banner")
+        except Exception:
+            pass
+
+    @staticmethod
+    def _save_download(download: Download, save_path: Path) -> None:
+        """Move a finished browser download to its final path.
+
+        Downloads are staged in DOWNLOADS_DIR, so this is normally a rename;
+        save_as() (a full copy) is only used across filesystems.
+
+        Args:
+            download: Completed Playwright download
+            save_path: Destination file path
+        """
+        try:
+            os.replace(download.path(), save_path)
+        except OSError:
+            download.save_as(save_path)
 
     def download_product_files(
-        self, output_dir: Path, sku: Optional[SKU] = None
+        self,
+        output_dir: Path,
+        sku: Optional[SKU] = None,
+        product_url: Optional[str] = None,
     ) -> bool:
         """Download product files using Playwright browser automation.
 
@@ -1261,6 +1510,7 @@ class VibiaScraper(BaseScraper):
         Args:
             output_dir: Directory to save downloaded files
             sku: Optional SKU to navigate to product page (if not already there)
+            product_url: Optional product page URL (takes precedence over sku)
 
         Returns:
             True if download successful, False otherwise
@@ -1268,13 +1518,14 @@ class VibiaScraper(BaseScraper):
         self._ensure_browser()
         assert self._page is not None
 
-        # Determine product URL - either from current page or build from SKU
-        if sku:
-            # Build URL from SKU and navigate
-            product_url = self.build_product_url(sku)
-        else:
-            # Use current page URL
-            product_url = self._page.url
+        # Determine product URL - given, built from SKU, or the current page
+        if product_url is None:
+            if sku:
+                # Build URL from SKU and navigate
+                product_url = self.build_product_url(sku)
+            else:
+                # Use current page URL
+                product_url = self._page.url
 
         # Login via API and inject cookies into browser
         if not self._login_and_inject_cookies():
@@ -1284,15 +1535,11 @@ class VibiaScraper(BaseScraper):
         # Navigate to product page with authenticated session
         logger.info(f"Navigating to product page: {product_url}")
         self._page.goto(product_url, wait_until="networkidle")
-        self._page.wait_for_timeout(PAGE_LOAD_DELAY)
 
-        # Dismiss modals that may block interactions
+        # Dismiss modals that may block interactions (each waits until hidden)
         self._dismiss_region_modal()
         self._dismiss_cookie_banner()
 
-        # Wait for page to stabilize after dismissing modals
-        self._page.wait_for_timeout(1000)
-
         try:
             logger.info("Looking for download trigger button...")
 
@@ -1312,8 +1559,7 @@ class VibiaScraper(BaseScraper):
                 return False
 
             logger.info("Clicking Download button to open modal...")
-            download_trigger.first.scroll_into_view_if_needed()
-            self._page.wait_for_timeout(500)  # Brief pause after scroll
+            download_trigger.first.scroll_into_view_if_needed()  # Waits until stable
             download_trigger.first.click(force=True)  # Force click to bypass any overlays
 
             # Wait for modal to appear - use specific Vibia modal selectors (not Cookiebot)
@@ -1328,10 +1574,8 @@ class VibiaScraper(BaseScraper):
                 logger.warning("Download modal not found within timeout")
                 return False
 
-            # Wait for modal animation and content to load
-            self._page.wait_for_timeout(MODAL_ANIMATION_DELAY)
-
-            # Wait for download buttons to appear in the modal
+            # Wait for download buttons to appear in the modal; clicks below
+            # wait for them to stop animating
             try:
                 self._page.wait_for_selector(
                     'button[data-qa^="download-"][class="download-icon"]',
@@ -1386,7 +1630,7 @@ class VibiaScraper(BaseScraper):
                         filename = f"{filename}{ext}"
 
                     save_path = save_dir / filename
-                    download.save_as(save_path)
+                    self._save_download(download, save_path)
                     downloaded_count += 1
                     logger.success(f"✓ Downloaded {label} to {save_path.name}")
 
@@ -16,6 +16,7 @@ def retry_with_backoff(
     base_delay: float = 1.0,
     exponential_base: float = 2.0,
     max_delay: float = 60.0,
+    retry_on: tuple[type[Exception], ...] = (Exception,),
 ) -> T:
     """Execute function with exponential backoff retry logic.
 
@@ -25,6 +26,7 @@ def retry_with_backoff(
         base_delay: Initial delay between retries in seconds
         exponential_base: Base for exponential backoff calculation
         max_delay: Maximum delay between retries in seconds
+        retry_on: Exception types that trigger a retry; others propagate immediately
 
     Returns:
         Result of successful function execution
@@ -37,7 +39,7 @@ def retry_with_backoff(
     for attempt in range(max_retries + 1):
         try:
             return func()
-        except Exception as e:
+        except retry_on as e:
             last_exception = e
 
             if attempt == max_retries:
@@ -123,6 +123,25 @@ PRODUCTS = _load_json_price_list()
 logger.info(f"Price list initialized with {len(PRODUCTS)} products")
 
 
+def _index_by_slug(products: dict[str, ProductInfo]) -> dict[str, list[ProductInfo]]:
+    """Group products by URL slug, preserving price list order.
+
+    Args:
+        products: Dictionary mapping model numbers to ProductInfo
+
+    Returns:
+        Dictionary mapping each URL slug to its products
+    """
+    index: dict[str, list[ProductInfo]] = {}
+    for product in products.values():
+        index.setdefault(product["url_slug"], []).append(product)
+    return index
+
+
+# Slug lookups run several times per scraped SKU; index once instead of scanning
+_PRODUCTS_BY_SLUG = _index_by_slug(PRODUCTS)
+
+
 def get_product_by_model(model: str) -> ProductInfo | None:
     """Get product information by model number.
 
@@ -144,7 +163,7 @@ def get_product_by_slug(slug: str) -> list[ProductInfo]:
     Returns:
         List of ProductInfo objects with matching slug
     """
-    return [p for p in PRODUCTS.values() if p["url_slug"] == slug]
+    return list(_PRODUCTS_BY_SLUG.get(slug, ()))
 
 
 def get_variant_price(sku: str) -> float | None:
@@ -105,6 +105,16 @@ class TestParseTableHeaderAttributes:
 
         assert result == {"Structure": "Metal"}
 
+    def test_cached_result_is_not_shared_between_calls(self):
+        """Test mutating a returned dict does not leak into later calls."""
+        headers = ("Structure: Metal",)
+
+        first = parse_table_header_attributes(headers)
+        first["Injected"] = "value"
+        second = parse_table_header_attributes(list(headers))
+
+        assert second == {"Structure": "Metal"}
+
 
 @pytest.mark.unit
 class TestParseWeightFromText:
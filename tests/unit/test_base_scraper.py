@@ -0,0 +1,78 @@
+"""Unit tests for base_scraper.py shared browser handling."""
+
+import pytest
+
+import src.scrapers.base_scraper as base_scraper
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.launches = 0
+        self.stopped = False
+        self.chromium = self
+
+    def launch(self, **kwargs):
+        self.launches += 1
+        return _FakeBrowser()
+
+    def start(self):
+        return self
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    """Replace the Playwright driver with a fake and reset shared state."""
+    playwright = _FakePlaywright()
+    monkeypatch.setattr(base_scraper, "sync_playwright", lambda: playwright)
+    monkeypatch.setattr(base_scraper.atexit, "register", lambda func: func)
+    monkeypatch.setattr(base_scraper, "_shared_playwright", None)
+    monkeypatch.setattr(base_scraper, "_shared_browsers", {})
+    yield playwright
+    base_scraper.close_shared_browsers()
+
+
+class TestGetSharedBrowser:
+    """Tests for get_shared_browser and close_shared_browsers."""
+
+    def test_reuses_browser_for_same_launch_options(self, fake_playwright):
+        """Should launch Chromium once per set of launch options."""
+        first = base_scraper.get_shared_browser({"headless": True})
+        second = base_scraper.get_shared_browser({"headless": True})
+        headed = base_scraper.get_shared_browser({"headless": False})
+
+        assert first is second
+        assert headed is not first
+        assert fake_playwright.launches == 2
+
+    def test_relaunches_disconnected_browser(self, fake_playwright):
+        """Should replace a browser that has disconnected."""
+        first = base_scraper.get_shared_browser({"headless": True})
+        first.close()
+
+        second = base_scraper.get_shared_browser({"headless": True})
+
+        assert second is not first
+        assert fake_playwright.launches == 2
+
+    def test_close_stops_driver(self, fake_playwright):
+        """Should close browsers and stop the driver."""
+        browser = base_scraper.get_shared_browser({"headless": True})
+
+        base_scraper.close_shared_browsers()
+
+        assert not browser.is_connected()
+        assert fake_playwright.stopped
@@ -1,6 +1,13 @@
 """Unit tests for lodes_scraper.py pure functions."""
 
-from src.scrapers.lodes_scraper import _is_numeric_sku
+import os
+import time
+
+import httpx
+import pytest
+from lxml import html as lxml_html
+
+from src.scrapers.lodes_scraper import LodesScraper, _is_numeric_sku
 
 
 class TestIsNumericSku:
@@ -77,3 +84,438 @@ class TestIsNumericSku:
         result = _is_numeric_sku("14126-abc")
 
         assert result is False
+
+
+class TestScrapeCache:
+    """Tests for LodesScraper disk cache helpers."""
+
+    def test_returns_saved_data_within_ttl(self, tmp_path):
+        """Should load data that was saved within the TTL."""
+        scraper = LodesScraper()
+        cache_file = scraper._get_cache_file(tmp_path, "https://www.lodes.com/de/")
+
+        scraper._save_to_cache(cache_file, {"skus": ["kelly", "megaphone"]})
+        result = scraper._load_from_cache(cache_file)
+
+        assert result is not None
+        assert result["skus"] == ["kelly", "megaphone"]
+
+    def test_returns_none_for_expired_entry(self, tmp_path):
+        """Should ignore cache files older than the TTL."""
+        scraper = LodesScraper()
+        cache_file = scraper._get_cache_file(tmp_path, "kelly")
+        scraper._save_to_cache(cache_file, {"skus": ["kelly"]})
+
+        expired = time.time() - scraper.config.cache_ttl_seconds - 1
+        os.utime(cache_file, (expired, expired))
+
+        assert scraper._load_from_cache(cache_file) is None
+
+    def test_disabled_when_ttl_is_zero(self, tmp_path):
+        """Should neither write nor read cache when TTL is 0."""
+        scraper = LodesScraper()
+        scraper.config.cache_ttl_seconds = 0
+        cache_file = scraper._get_cache_file(tmp_path, "kelly")
+
+        scraper._save_to_cache(cache_file, {"skus": ["kelly"]})
+
+        assert not cache_file.exists()
+        assert scraper._load_from_cache(cache_file) is None
+
+    def test_env_var_overrides_ttl(self, monkeypatch):
+        """Should take the cache lifetime from LODES_CACHE_TTL."""
+        monkeypatch.setenv("LODES_CACHE_TTL", "0")
+
+        assert LodesScraper().config.cache_ttl_seconds == 0
+
+    def test_product_cache_keyed_by_price_list_version(self, tmp_path, monkeypatch):
+        """Should not serve a cached product once the price list changes."""
+        import src.scrapers.lodes_scraper as lodes_module
+
+        scraper = LodesScraper()
+        scraper._product_cache_dir = tmp_path
+        scraper._save_to_cache(
+            scraper._get_cache_file(
+                tmp_path, f"kelly@{lodes_module.lodes_price_list.PRICE_LIST_VERSION}"
+            ),
+            {
+                "products": [
+                    {
+                        "sku": "kelly",
+                        "name": "Kelly",
+                        "description": "",
+                        "manufacturer": "lodes",
+                        "categories": [],
+                        "attributes": {},
+                        "images": [],
+                    }
+                ]
+            },
+        )
+
+        def no_browser():
+            raise RuntimeError("page fetched")
+
+        monkeypatch.setattr(scraper, "_ensure_browser", no_browser)
+
+        assert scraper.scrape_product("kelly")[0].name == "Kelly"
+
+        monkeypatch.setattr(
+            lodes_module.lodes_price_list, "PRICE_LIST_VERSION", "new-price-list"
+        )
+        with pytest.raises(RuntimeError, match="page fetched"):
+            scraper.scrape_product("kelly")
+
+
+class TestExtractCertifications:
+    """Tests for LodesScraper._extract_certifications."""
+
+    def test_finds_badges_anywhere_on_page(self):
+        """Should scan the whole page, not only the spec containers."""
+        page_html = (
+            "<html><body><div class='secondary-info'>Hills: 2</div>"
+            "<footer><span>IP44</span> <span>220-240 V</span> CE</footer>"
+            "</body></html>"
+        )
+
+        result = LodesScraper()._extract_certifications(page_html, {})
+
+        assert result == {
+            "IP Rating": "44",
+            "Voltage": "220-240 V",
+            "Certification": "CE",
+        }
+
+    def test_keeps_existing_attributes(self):
+        """Should not overwrite attributes found elsewhere."""
+        result = LodesScraper()._extract_certifications(
+            "<p>IP44</p>", {"IP Rating": "20"}
+        )
+
+        assert result == {}
+
+
+class TestIsProductImage:
+    """Tests for LodesScraper._is_product_image."""
+
+    def test_accepts_product_photo(self):
+        """Should accept regular product image URLs."""
+        scraper = LodesScraper()
+
+        assert scraper._is_product_image(
+            "https://www.lodes.com/wp-content/uploads/kelly-dome-50.jpg"
+        )
+
+    def test_rejects_excluded_patterns(self):
+        """Should reject logos, icons and SVGs regardless of case."""
+        scraper = LodesScraper()
+
+        assert not scraper._is_product_image("https://www.lodes.com/img/Logo-white.png")
+        assert not scraper._is_product_image("https://www.lodes.com/img/icon-cart.png")
+        assert not scraper._is_product_image("https://www.lodes.com/img/arrow.SVG")
+
+
+class TestVariantTableParsing:
+    """Tests for variant table header/row parsing from extracted cell texts."""
+
+    def test_builds_header_map_from_texts(self):
+        """Should clean header names and keep the grouping first column."""
+        scraper = LodesScraper()
+
+        header_map = scraper._build_header_index_map(
+            ["Kelly medium dome 60", "Structure: Metal", "", "Diffusor"]
+        )
+
+        assert header_map == [
+            (0, "Kelly medium dome 60"),
+            (1, "Structure"),
+            (3, "Diffusor"),
+        ]
+
+    def test_parses_row_and_detects_product_code(self):
+        """Should map cells to headers and store product codes as Code."""
+        scraper = LodesScraper()
+        header_map = [(0, "Group"), (1, "Structure")]
+
+        variant = scraper._parse_variant_row([" 14126 1000 ", "Matte White\n"], header_map)
+
+        assert variant == {"Code": "14126 1000", "Structure": "Matte White"}
+
+    def test_empty_row_returns_empty_dict(self):
+        """Should return empty dict for rows without cells."""
+        scraper = LodesScraper()
+
+        assert scraper._parse_variant_row([], [(0, "Group")]) == {}
+
+
+class TestGetFullResolutionUrl:
+    """Tests for LodesScraper._get_full_resolution_url."""
+
+    def test_strips_size_suffixes(self):
+        """Should remove thumbnail and scaled suffixes."""
+        scraper = LodesScraper()
+
+        assert (
+            scraper._get_full_resolution_url("https://x.com/kelly-300x300.jpg")
+            == "https://x.com/kelly.jpg"
+        )
+        assert (
+            scraper._get_full_resolution_url("https://x.com/kelly-1024x1024-scaled.jpg")
+            == "https://x.com/kelly.jpg"
+        )
+
+    def test_leaves_full_resolution_url_unchanged(self):
+        """Should return URLs without size suffixes unchanged."""
+        scraper = LodesScraper()
+
+        assert (
+            scraper._get_full_resolution_url("https://x.com/kelly-dome.jpg")
+            == "https://x.com/kelly-dome.jpg"
+        )
+
+
+class TestExtractImages:
+    """Tests for LodesScraper._extract_images."""
+
+    def test_filters_upscales_and_dedups_carousel_srcs(self):
+        """Should filter, upscale and dedup carousel image srcs."""
+        tree = lxml_html.fromstring(
+            """<div>
+            <img class="carousel-cell-image" src="https://www.lodes.com/wp-content/uploads/kelly-300x300.jpg">
+            <img class="carousel-cell-image" src="https://www.lodes.com/wp-content/uploads/kelly.jpg">
+            <img class="carousel-cell-image" src="https://www.lodes.com/wp-content/uploads/logo.png">
+            <img class="carousel-cell-image">
+            </div>"""
+        )
+
+        images = LodesScraper()._extract_images(tree)
+
+        assert images == ["https://www.lodes.com/wp-content/uploads/kelly.jpg"]
+
+    def test_stops_at_max_images(self):
+        """Should return at most MAX_IMAGES unique images."""
+        scraper = LodesScraper()
+        imgs = "".join(
+            f'<img class="carousel-cell-image" src="https://www.lodes.com/p{i}.jpg">'
+            for i in range(scraper.MAX_IMAGES + 5)
+        )
+
+        images = scraper._extract_images(lxml_html.fromstring(f"<div>{imgs}</div>"))
+
+        assert len(images) == scraper.MAX_IMAGES
+        assert images[-1] == f"https://www.lodes.com/p{scraper.MAX_IMAGES - 1}.jpg"
+
+
+class TestParsedPageExtraction:
+    """Tests for extractors that read the parsed product page HTML."""
+
+    PAGE_HTML = """<html><head><title>Kelly | Lodes</title></head><body>
+        <div class="bread-crumbs shadow">
+            <span class="bred2"><a> Pendelleuchten </a></span>
+            <span class="bred3"><a></a></span>
+        </div>
+        <div class="variante">
+            <div class="header-variante relative">
+                <div class="left col25 font26 serif"> Kelly medium dome 60 </div>
+            </div>
+            <table class="table-variante">
+                <thead><tr><th>Kelly medium dome 60</th><th>Structure</th></tr></thead>
+                <tbody>
+                    <tr><td>14126 1000</td><td>Matte White</td></tr>
+                    <tr><td>14126 1000</td><td>Matte White</td></tr>
+                    <tr><td>14126 2000</td><td>Matte Black</td></tr>
+                </tbody>
+            </table>
+        </div>
+        </body></html>"""
+
+    def test_extracts_categories_from_breadcrumbs(self):
+        """Should return trimmed, non-empty breadcrumb link texts."""
+        tree = lxml_html.fromstring(self.PAGE_HTML)
+
+        assert LodesScraper()._extract_categories(tree) == ["Pendelleuchten"]
+
+    def test_falls_back_to_page_title_for_name(self):
+        """Should use the <title> prefix when the product heading is missing."""
+        tree = lxml_html.fromstring(self.PAGE_HTML)
+
+        assert LodesScraper()._extract_product_name(tree, None) == "Kelly"
+
+    def test_secondary_info_text_feeds_weight_and_cable_length(self):
+        """Should parse weight, hills and cable length from one info string."""
+        scraper = LodesScraper()
+        info_text = "Net weight: 2,5 kg - Seillänge max 250 cm"
+
+        secondary = scraper._extract_from_secondary_info(info_text)
+        cable_length = scraper._extract_cable_length(
+            lxml_html.fromstring(self.PAGE_HTML), info_text
+        )
+
+        assert "Net weight" in secondary
+        assert cable_length == "max 250cm"
+
+    def test_table_attributes_use_parsed_header_cells(self):
+        """Should parse key/value headers from every table's header cells."""
+        tables = [
+            {"header_cells": [" Structure: Metal ", "  "], "headers": [], "rows": []},
+            {"header_cells": ["Diffusor: Glas"], "headers": [], "rows": []},
+        ]
+
+        attributes = LodesScraper()._extract_table_attributes(tables)
+
+        assert attributes == {"Structure": "Metal", "Diffusor": "Glas"}
+
+    def test_parses_variant_tables_once_into_text(self):
+        """Should return header and row texts per variant table."""
+        tree = lxml_html.fromstring(self.PAGE_HTML)
+
+        tables = LodesScraper()._parse_variant_tables(tree)
+
+        assert len(tables) == 1
+        assert tables[0]["headers"] == ["Kelly medium dome 60", "Structure"]
+        assert tables[0]["rows"][2] == ["14126 2000", "Matte Black"]
+
+    def test_extracts_deduplicated_variants(self):
+        """Should parse variant rows, skip duplicate codes and add variant type."""
+        tree = lxml_html.fromstring(self.PAGE_HTML)
+
+        scraper = LodesScraper()
+        variants = scraper._extract_variants(tree, scraper._parse_variant_tables(tree))
+
+        assert [variant["Code"] for variant in variants] == ["14126 1000", "14126 2000"]
+        assert variants[0]["Variant Type"] == "Kelly medium dome 60"
+
+
+class _FakeScrollPage:
+    """Page stub whose product link count follows a fixed sequence."""
+
+    def __init__(self, counts: list[int]):
+        self.counts = iter(counts)
+        self.scrolls = 0
+
+    def evaluate(self, script, arg=None):
+        if "scrollTo" in script:
+            self.scrolls += 1
+            return None
+        return next(self.counts)
+
+    def wait_for_timeout(self, timeout):
+        pass
+
+
+class TestScrollToLoadProducts:
+    """Tests for LodesScraper._scroll_to_load_products."""
+
+    def test_stops_after_consecutive_scrolls_without_growth(self):
+        """Should stop once two scrolls in a row load no new product links."""
+        scraper = LodesScraper()
+        scraper._page = _FakeScrollPage([10, 20, 20, 20])
+
+        scraper._scroll_to_load_products()
+
+        assert scraper._page.scrolls == 3
+
+    def test_keeps_scrolling_after_a_single_stall(self):
+        """Should reset the stall counter when new links appear again."""
+        scraper = LodesScraper()
+        scraper._page = _FakeScrollPage([10, 10, 20, 20, 20])
+
+        scraper._scroll_to_load_products()
+
+        assert scraper._page.scrolls == 4
+
+    def test_caps_number_of_scrolls(self):
+        """Should not scroll more than MAX_CATEGORY_SCROLLS times."""
+        scraper = LodesScraper()
+        scraper._page = _FakeScrollPage(range(0, 1000, 10))
+
+        scraper._scroll_to_load_products()
+
+        assert scraper._page.scrolls == scraper.MAX_CATEGORY_SCROLLS
+
+
+class TestUrlExists:
+    """Tests for LodesScraper._url_exists HEAD probe."""
+
+    def _scraper_with_transport(self, handler) -> LodesScraper:
+        scraper = LodesScraper()
+        scraper._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        return scraper
+
+    def test_returns_false_for_404(self):
+        """Should report a missing page so the language can be skipped."""
+        scraper = self._scraper_with_transport(lambda request: httpx.Response(404))
+
+        assert scraper._url_exists("https://www.lodes.com/en/products/x/") is False
+
+    def test_returns_true_for_other_statuses(self):
+        """Should defer to the browser for anything but a definite 404/410."""
+        scraper = self._scraper_with_transport(lambda request: httpx.Response(403))
+
+        assert scraper._url_exists("https://www.lodes.com/en/products/x/") is True
+
+    def test_returns_true_on_network_error(self):
+        """Should not skip a language because the probe itself failed."""
+
+        def handler(request):
+            raise httpx.ConnectError("boom", request=request)
+
+        scraper = self._scraper_with_transport(handler)
+
+        assert scraper._url_exists("https://www.lodes.com/en/products/x/") is True
+
+
+class _FakeRoute:
+    """Minimal stand-in for a Playwright Route."""
+
+    def __init__(self, resource_type: str):
+        self.request = type("Request", (), {"resource_type": resource_type})()
+        self.action = None
+
+    def abort(self):
+        self.action = "abort"
+
+    def continue_(self):
+        self.action = "continue"
+
+
+class TestRouteRequest:
+    """Tests for BaseScraper._route_request resource blocking."""
+
+    def test_aborts_image_requests(self):
+        """Should abort image downloads."""
+        route = _FakeRoute("image")
+
+        LodesScraper()._route_request(route)
+
+        assert route.action == "abort"
+
+    def test_aborts_stylesheets_for_lodes(self):
+        """Should also block stylesheets, which Lodes extraction never needs."""
+        route = _FakeRoute("stylesheet")
+
+        LodesScraper()._route_request(route)
+
+        assert route.action == "abort"
+
+    def test_continues_document_requests(self):
+        """Should let documents and scripts through."""
+        route = _FakeRoute("document")
+
+        LodesScraper()._route_request(route)
+
+        assert route.action == "continue"
+
+
+class TestScrapeProductValidation:
+    """Tests for SKU validation at the start of scrape_product."""
+
+    def test_rejects_sku_with_invalid_characters(self):
+        """Should raise before touching the browser for unsafe input."""
+        with pytest.raises(ValueError, match="invalid characters"):
+            LodesScraper().scrape_product("kelly/../etc")
+
+    def test_rejects_non_ascii_sku(self):
+        """Should reject letters outside ASCII."""
+        with pytest.raises(ValueError, match="invalid characters"):
+            LodesScraper().scrape_product("kellü")
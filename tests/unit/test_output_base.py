@@ -20,27 +20,26 @@ from src.orchestrator import ScraperOrchestrator
 class TestVibiaScraperOutputBase:
     """Test Vibia scraper respects output_base parameter."""
 
+    # Keep the HTTP fast path offline so the page goes through the mocked browser
+    @patch(
+        "src.scrapers.vibia_scraper.VibiaScraper._fetch_json_via_http",
+        return_value=(None, None),
+    )
     @patch("src.scrapers.vibia_scraper.VibiaScraper._ensure_browser")
     @patch("src.scrapers.vibia_scraper.VibiaScraper._extract_json_data")
     @patch("src.scrapers.vibia_scraper.VibiaScraper.download_product_files")
     def test_scrape_product_uses_custom_output_base(
-        self, mock_download, mock_json, mock_browser
+        self, mock_download, mock_json, mock_browser, mock_http
     ):
         """Should use custom output_base when downloading files."""
         # Setup mocks
         mock_json.return_value = {
-            "props": {
-                "pageProps": {
-                    "featureProps": {
-                        "data": {
-                            "name": "Test Product",
-                            "technicalInfo": {"description": []},
-                            "hero": {"media": {}},
-                        },
-                        "collection": {},
-                    }
-                }
-            }
+            "data": {
+                "name": "Test Product",
+                "technicalInfo": {"description": []},
+                "hero": {"media": {}},
+            },
+            "collection": {},
         }
 
         scraper = VibiaScraper()
@@ -60,27 +59,26 @@ class TestVibiaScraperOutputBase:
         assert output_dir_normalized.startswith(custom_output)
         assert "0162" in output_dir_normalized
 
+    # Keep the HTTP fast path offline so the page goes through the mocked browser
+    @patch(
+        "src.scrapers.vibia_scraper.VibiaScraper._fetch_json_via_http",
+        return_value=(None, None),
+    )
     @patch("src.scrapers.vibia_scraper.VibiaScraper._ensure_browser")
     @patch("src.scrapers.vibia_scraper.VibiaScraper._extract_json_data")
     @patch("src.scrapers.vibia_scraper.VibiaScraper.download_product_files")
     def test_scrape_product_uses_default_output_base(
-        self, mock_download, mock_json, mock_browser
+        self, mock_download, mock_json, mock_browser, mock_http
     ):
         """Should use default 'output' when output_base not provided."""
         # Setup mocks
         mock_json.return_value = {
-            "props": {
-                "pageProps": {
-                    "featureProps": {
-                        "data": {
-                            "name": "Test Product",
-                            "technicalInfo": {"description": []},
-                            "hero": {"media": {}},
-                        },
-                        "collection": {},
-                    }
-                }
-            }
+            "data": {
+                "name": "Test Product",
+                "technicalInfo": {"description": []},
+                "hero": {"media": {}},
+            },
+            "collection": {},
         }
 
         scraper = VibiaScraper()
@@ -260,3 +258,15 @@ class TestCaseInsensitiveImageDetection:
         assert "root.jpg" in image_names_lower
         assert "middle.png" in image_names_lower
         assert "deep.jpeg" in image_names_lower
+
+    def test_find_image_files_matches_any_case_and_skips_other_files(self, tmp_path):
+        """Should match mixed-case extensions and ignore non-image files."""
+        (tmp_path / "a.Jpg").touch()
+        (tmp_path / "b.WebP").touch()
+        (tmp_path / "manual.pdf").touch()
+        (tmp_path / "jpg").mkdir()
+
+        scraper = VibiaScraper()
+        found_images = scraper._find_image_files(tmp_path)
+
+        assert [img.name for img in found_images] == ["a.Jpg", "b.WebP"]
@@ -69,3 +69,10 @@ def test_scraper_can_be_instantiated():
 
     assert isinstance(scraper, BaseScraper)
     assert isinstance(scraper, LodesScraper)
+
+
+@pytest.mark.unit
+def test_registry_is_read_only():
+    """Should not allow modifying the registry at runtime."""
+    with pytest.raises(TypeError):
+        SCRAPER_REGISTRY["flos"] = LodesScraper  # type: ignore[index]
@@ -117,3 +117,20 @@ def test_max_delay_cap():
 
     delay_2 = call_times[2] - call_times[1]
     assert 0.08 <= delay_2 <= 0.15  # Also capped
+
+
+@pytest.mark.unit
+def test_only_retries_listed_exception_types():
+    """Should re-raise exceptions outside retry_on without retrying."""
+    calls = []
+
+    def failing_func():
+        calls.append(1)
+        raise ValueError("Not retryable")
+
+    with pytest.raises(ValueError):
+        retry_with_backoff(
+            failing_func, max_retries=3, base_delay=0.01, retry_on=(TimeoutError,)
+        )
+
+    assert len(calls) == 1
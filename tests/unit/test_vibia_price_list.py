@@ -51,6 +51,19 @@ class TestGetProductBySlug:
         models = {p["base_sku"] for p in results}
         assert models == {"0162", "0167", "0164"}
 
+    def test_matches_linear_scan_for_every_slug(self):
+        for slug in {p["url_slug"] for p in vibia_price_list.PRODUCTS.values()}:
+            expected = [
+                p for p in vibia_price_list.PRODUCTS.values() if p["url_slug"] == slug
+            ]
+            assert vibia_price_list.get_product_by_slug(slug) == expected
+
+    def test_returned_list_does_not_alias_index(self):
+        slug = next(iter(vibia_price_list.PRODUCTS.values()))["url_slug"]
+        expected = len(vibia_price_list.get_product_by_slug(slug))
+        vibia_price_list.get_product_by_slug(slug).clear()
+        assert len(vibia_price_list.get_product_by_slug(slug)) == expected > 0
+
 
 class TestGetVariantPrice:
     """Tests for get_variant_price function."""